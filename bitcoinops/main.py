@@ -10,7 +10,7 @@ from loguru import logger
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from common.elasticsearch_utils import upsert_document
+from common.elasticsearch_utils import bulk_upsert
 from common.utils import parse_markdown
 
 from config.conf import DATA_DIR, INDEX_NAME
@@ -103,20 +103,12 @@ async def main():
     await download_repo()
     all_posts = dir_walk(os.path.join(DIR_PATH, POST_DIR), "posts")
     all_topics = dir_walk(os.path.join(DIR_PATH, TOPIC_DIR), "topic")
-    new_ids = set()
-    updated_ids = set()
     all_posts.extend(all_topics)
-    for post in all_posts:
-        try:
-            res = upsert_document(index_name=INDEX_NAME, doc_id=post['id'], doc_body=post)
-            logger.info(f"Version-{res['_version']}, Result-{res['result']}, ID-{res['_id']}")
-            if res['result'] == 'created':
-                new_ids.add(res['_id'])
-            if res['result'] == 'updated':
-                updated_ids.add(res['_id'])
-        except Exception as e:
-            logger.error(f"Error: {e}")
-            logger.warning(post)
+    res = bulk_upsert(index_name=INDEX_NAME, docs=all_posts)
+    new_ids = res['created']
+    updated_ids = res['updated']
+    for failure in res['failed']:
+        logger.error(f"Error: {failure['error']}, ID-{failure['id']}")
     logger.info(f"Inserted {len(new_ids)} new documents")
     logger.info(f"Updated {len(updated_ids)} documents")
 
@@ -11,7 +11,7 @@ from requests import request
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from common.elasticsearch_utils import upsert_document
+from common.elasticsearch_utils import bulk_upsert
 from config.conf import INDEX_NAME, DATA_DIR, START_INDEX
 
 BOARD_URL = 'https://bitcointalk.org/index.php?board=6.'
@@ -162,17 +162,14 @@ def main() -> None:
         topic = topics[i]
         logger.info(f"Processing {i + 1}/{len(topics)}")
         documents = fetch_posts(topic)
-        for document in documents:
-            try:
-                res = upsert_document(index_name=INDEX_NAME, doc_id=document['id'], doc_body=document)
-                logger.info(f"Version-{res['_version']}, Result-{res['result']}, ID-{res['_id']}")
-                if res['result'] == 'created':
-                    new_ids.add(res['_id'])
-                if res['result'] == 'updated':
-                    updated_ids.add(res['_id'])
-            except Exception as ex:
-                logger.error(f"{ex} \n{traceback.format_exc()}")
-                logger.warning(document)
+        try:
+            res = bulk_upsert(index_name=INDEX_NAME, docs=documents)
+            new_ids.update(res['created'])
+            updated_ids.update(res['updated'])
+            for failure in res['failed']:
+                logger.error(f"{failure['error']}, ID-{failure['id']}")
+        except Exception as ex:
+            logger.error(f"{ex} \n{traceback.format_exc()}")
 
     logger.info(f"Inserted {len(new_ids)} new documents")
     logger.info(f"Updated {len(updated_ids)} documents")
@@ -2,7 +2,6 @@ import asyncio
 import os
 import re
 import sys
-import traceback
 import zipfile
 from datetime import datetime
 
@@ -12,7 +11,7 @@ from loguru import logger
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from common.elasticsearch_utils import upsert_document
+from common.elasticsearch_utils import bulk_upsert
 from common.utils import parse_markdown
 from config.conf import DATA_DIR, INDEX_NAME
 
@@ -108,22 +107,13 @@ async def main():
     documents = parse_posts(GLOBAL_URL_VARIABLE)
     logger.info(f"Filtering existing {len(documents)} documents... please wait...")
 
-    new_ids = set()
-    updated_ids = set()
-    for document in documents:
-        try:
-            # Update the provided fields with those in the existing document,
-            # ensuring that any fields not specified in 'doc_body' remain unchanged in the ES document
-            res = upsert_document(index_name=INDEX_NAME, doc_id=document['id'], doc_body=document)
-            if res['result'] == 'created':
-                logger.success(f"Version: {res['_version']}, Result: {res['result']}, ID: {res['_id']}")
-                new_ids.add(res['_id'])
-            if res['result'] == 'updated':
-                updated_ids.add(res['_id'])
-                logger.info(f"Version: {res['_version']}, Result: {res['result']}, ID: {res['_id']}")
-        except Exception as ex:
-            logger.error(f"{ex} \n{traceback.format_exc()}")
-            logger.warning(document)
+    # Update the provided fields with those in the existing document,
+    # ensuring that any fields not specified in 'doc_body' remain unchanged in the ES document
+    res = bulk_upsert(index_name=INDEX_NAME, docs=documents)
+    new_ids = res['created']
+    updated_ids = res['updated']
+    for failure in res['failed']:
+        logger.error(f"{failure['error']} \nID: {failure['id']}")
 
     logger.info(f"Inserted {len(new_ids)} new documents")
     logger.info(f"Updated {len(updated_ids)} documents")
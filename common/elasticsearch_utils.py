@@ -1,10 +1,12 @@
+import hashlib
+import json
 import os
 import sys
 import time
 
 from elasticsearch import BadRequestError
 from elasticsearch import Elasticsearch, NotFoundError
-from elasticsearch.exceptions import ConflictError
+from elasticsearch.helpers import parallel_bulk
 from loguru import logger
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -59,22 +61,51 @@ def delete_index(index_name):
     return resp
 
 
+def document_hash(doc):
+    """
+    SHA-256 of a document's content, used to skip rewriting unchanged documents.
+
+    `indexed_at` and `content_hash` itself are left out, so re-scraping the
+    same content always gives the same hash.
+    """
+    content = {k: v for k, v in doc.items() if k not in ("indexed_at", "content_hash")}
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def existing_documents(index_name, doc_ids, batch_size=5000):
+    """
+    Looks up which documents exist, with one `mget` per `batch_size` ids.
+
+    Only the stored `content_hash` is fetched, not the document source.
+
+    Args:
+        index_name (str): The name of the Elasticsearch index.
+        doc_ids (iterable): Document ids to look up.
+        batch_size (int): Maximum number of ids per request.
+
+    Returns:
+        dict: Stored content hash (None if the document has none) of each
+        existing document, keyed by id. Missing documents are left out.
+    """
+    doc_ids = list(dict.fromkeys(doc_ids))
+    existing = {}
+    for start in range(0, len(doc_ids), batch_size):
+        resp = ES.mget(
+            index=index_name,
+            ids=doc_ids[start:start + batch_size],
+            source_includes=["content_hash"],
+        )
+        for doc in resp["docs"]:
+            if doc.get("found"):
+                existing[doc["_id"]] = doc.get("_source", {}).get("content_hash")
+    return existing
+
+
 def document_exist(index_name, doc_id):
-    body = {
-        "query": {
-            "bool": {
-                "must": [
-                    {
-                        "term": {
-                            "id.keyword": doc_id
-                        }
-                    }
-                ]
-            }
-        }
-    }
-    resp = ES.count(index=index_name, body=body)
-    return resp["count"] > 0
+    """Function to check whether a document exists."""
+    return doc_id in existing_documents(index_name, [doc_id])
 
 
 def upsert_document(index_name, doc_id, doc_body):
@@ -108,50 +139,214 @@ def upsert_document(index_name, doc_id, doc_body):
     return response
 
 
-def update_authors_names_from_es(index, old_author, new_author, max_retries=3, retry_delay=2):
-    if es.ping():
-        script = {
-            "source": f"""
-                for (int i = 0; i < ctx._source.authors.size(); i++) {{
-                    if (ctx._source.authors[i] == '{old_author}') {{
-                        ctx._source.authors[i] = '{new_author}';
-                    }}
-                }}
-            """
-        }
+def _parallel_bulk_results(actions, op_type, chunk_bytes, concurrency, chunk_size):
+    """
+    Sends bulk actions with parallel `_bulk` requests and sorts the outcomes.
+
+    Returns:
+        dict: 'created', 'updated' and 'noop' sets of document ids, and a
+        'failed' list of {'id', 'error'} dicts.
+    """
+    result = {"created": set(), "updated": set(), "noop": set(), "failed": []}
+    for ok, item in parallel_bulk(
+        ES,
+        actions,
+        thread_count=concurrency,
+        chunk_size=chunk_size,
+        max_chunk_bytes=chunk_bytes,
+        raise_on_error=False,
+        raise_on_exception=False,
+    ):
+        info = item[op_type]
+        if ok:
+            result.setdefault(info["result"], set()).add(info["_id"])
+        else:
+            result["failed"].append({"id": info.get("_id"), "error": info.get("error")})
+    return result
+
+
+def bulk_upsert(index_name, docs, chunk_bytes=10 * 1024 * 1024, concurrency=4, chunk_size=500):
+    """
+    Upserts many documents with parallel `_bulk` requests.
+
+    Each document is sent as an update action running the same
+    `ctx._source.putAll(params)` script as `upsert_document`, so fields not
+    present in the new document are kept in the stored one.
 
-        query = {
-            "bool": {
-                "must": [
-                    {
-                        "term": {
-                            "authors.keyword": old_author
-                        }
-                    }
-                ]
+    Args:
+        index_name (str): The name of the Elasticsearch index.
+        docs (iterable): Documents to upsert, each with an 'id' field.
+        chunk_bytes (int): Maximum size of a single bulk request in bytes.
+        concurrency (int): Number of bulk requests sent in parallel.
+        chunk_size (int): Maximum number of documents in a single bulk request.
+
+    Returns:
+        dict: 'created', 'updated' and 'noop' sets of document ids, and a
+        'failed' list of {'id', 'error'} dicts.
+    """
+    def actions():
+        for doc in docs:
+            yield {
+                "_op_type": "update",
+                "_index": index_name,
+                "_id": doc["id"],
+                "scripted_upsert": True,
+                "script": {"source": "ctx._source.putAll(params)", "params": doc},
+                # The script fills the empty upsert document on creation
+                "upsert": {},
             }
+
+    result = _parallel_bulk_results(actions(), "update", chunk_bytes, concurrency, chunk_size)
+    logger.info(
+        f"Bulk upsert to {index_name}: {len(result['created'])} created, "
+        f"{len(result['updated'])} updated, {len(result['noop'])} unchanged, "
+        f"{len(result['failed'])} failed"
+    )
+    return result
+
+
+def bulk_index(index_name, docs, chunk_bytes=10 * 1024 * 1024, concurrency=4, chunk_size=500):
+    """
+    Indexes many documents with parallel `_bulk` requests.
+
+    Unlike `bulk_upsert`, each document replaces the stored one, as
+    `document_add` does, so fields missing from the new document are removed.
+
+    Args:
+        index_name (str): The name of the Elasticsearch index.
+        docs (iterable): Documents to index, each with an 'id' field.
+        chunk_bytes (int): Maximum size of a single bulk request in bytes.
+        concurrency (int): Number of bulk requests sent in parallel.
+        chunk_size (int): Maximum number of documents in a single bulk request.
+
+    Returns:
+        dict: 'created' and 'updated' sets of document ids, and a 'failed'
+        list of {'id', 'error'} dicts.
+    """
+    def actions():
+        for doc in docs:
+            yield {"_op_type": "index", "_index": index_name, "_id": doc["id"], "_source": doc}
+
+    result = _parallel_bulk_results(actions(), "index", chunk_bytes, concurrency, chunk_size)
+    logger.info(
+        f"Bulk index to {index_name}: {len(result['created'])} created, "
+        f"{len(result['updated'])} updated, {len(result['failed'])} failed"
+    )
+    return result
+
+
+def wait_for_task(task_id, poll_interval=5):
+    """
+    Polls a background task (e.g. `update_by_query` run with
+    `wait_for_completion=False`) until it completes, logging its progress.
+
+    Returns:
+        dict: The task's final response.
+    """
+    while True:
+        task = ES.tasks.get(task_id=task_id)
+        status = task["task"]["status"]
+        if task["completed"]:
+            if "error" in task:
+                raise RuntimeError(f"Task {task_id} failed: {task['error']}")
+            return task["response"]
+        done = status["updated"] + status["created"] + status["deleted"] + status["noops"]
+        logger.info(
+            f"Task {task_id}: {done}/{status['total']} documents processed, "
+            f"{status['version_conflicts']} version conflicts"
+        )
+        time.sleep(poll_interval)
+
+
+# Rewrites every alias found in a document's authors in one pass; documents
+# without any alias are left untouched (noop) so they are not reindexed
+AUTHORS_SYNONYMS_SCRIPT = """
+    boolean changed = false;
+    for (int i = 0; i < ctx._source.authors.size(); i++) {
+        def name = ctx._source.authors[i];
+        if (name != null && params.synonyms.containsKey(name)) {
+            ctx._source.authors[i] = params.synonyms[name];
+            changed = true;
         }
+    }
+    if (!changed) {
+        ctx.op = 'noop';
+    }
+"""
 
-        attempt = 0
-        while attempt < max_retries:
-            try:
-                response = ES.update_by_query(
-                    index=index,
-                    body={
-                        "script": script,
-                        "query": query
-                    }
-                )
-                logger.success(f"Updated {response['total']} documents: '{old_author}' --> '{new_author}'")
-                return response
-            except ConflictError as ex:
-                attempt += 1
-                if attempt < max_retries:
-                    logger.warning(f"Version conflict occurred. Retry {attempt}/{max_retries}...")
-                    time.sleep(retry_delay)
-                else:
-                    logger.error(f"Failed to update documents after {max_retries} retries: {ex}")
-                    raise
-    else:
+
+def update_authors_names_from_es(index, synonyms, max_retries=3, retry_delay=2, poll_interval=5):
+    """
+    Replaces author aliases with their canonical names across an index.
+
+    All aliases are rewritten by a single sliced `update_by_query`: the whole
+    alias->canonical mapping is passed as script params and the affected
+    documents are matched with one `terms` query on `authors.keyword`. The
+    task runs in the background and is polled until it completes.
+
+    Version conflicts do not abort the run. Conflicting documents still hold
+    an alias, so they are matched again by the next attempt, which resumes
+    the rewrite until no conflicts remain or `max_retries` is reached.
+
+    Args:
+        index (str): The name of the Elasticsearch index.
+        synonyms (dict): Canonical author name of each alias.
+        max_retries (int): Number of extra passes made over conflicting documents.
+        retry_delay (int): Seconds to wait before each extra pass.
+        poll_interval (int): Seconds between task status checks.
+
+    Returns:
+        dict: Total 'updated', 'noops', 'version_conflicts' and 'failures'.
+    """
+    if not ES.ping():
         logger.warning('Could not connect to Elasticsearch')
         return None
+
+    # Aliases parsed with literal_eval may be numbers, authors are matched as strings
+    synonyms = {str(alias).strip(): name for alias, name in synonyms.items()}
+    synonyms = {alias: name for alias, name in synonyms.items() if alias != name}
+    if not synonyms:
+        logger.info("No author synonyms to update")
+        return None
+
+    totals = {"updated": 0, "noops": 0, "version_conflicts": 0, "failures": []}
+    for attempt in range(max_retries + 1):
+        if attempt:
+            logger.warning(
+                f"{totals['version_conflicts']} version conflicts, resuming. Retry {attempt}/{max_retries}..."
+            )
+            time.sleep(retry_delay)
+
+        task = ES.update_by_query(
+            index=index,
+            body={
+                "script": {
+                    "source": AUTHORS_SYNONYMS_SCRIPT,
+                    "lang": "painless",
+                    "params": {"synonyms": synonyms},
+                },
+                "query": {"terms": {"authors.keyword": list(synonyms)}},
+            },
+            slices="auto",
+            conflicts="proceed",
+            refresh=True,
+            wait_for_completion=False,
+        )
+        response = wait_for_task(task["task"], poll_interval=poll_interval)
+
+        totals["updated"] += response["updated"]
+        totals["noops"] += response["noops"]
+        totals["version_conflicts"] = response["version_conflicts"]
+        totals["failures"].extend(response["failures"])
+        if not response["version_conflicts"]:
+            break
+    else:
+        logger.error(
+            f"{totals['version_conflicts']} documents still conflicting after {max_retries} retries"
+        )
+
+    logger.success(
+        f"Updated {totals['updated']} documents for {len(synonyms)} author aliases "
+        f"({len(totals['failures'])} failures)"
+    )
+    return totals
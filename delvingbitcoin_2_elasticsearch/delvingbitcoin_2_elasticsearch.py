@@ -10,7 +10,7 @@ from loguru import logger as log
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from common.elasticsearch_utils import document_add, document_view, create_index
+from common.elasticsearch_utils import bulk_upsert, create_index, existing_documents
 
 from achieve import download_dumps
 
@@ -61,6 +61,7 @@ def strip_attributes_but_urls(html):
 
 
 def index_documents(files_path):
+    docs = []
     # Iterate through files in the specified path
     for root, dirs, files in os.walk(files_path):
         for file in files:
@@ -98,13 +99,16 @@ def index_documents(files_path):
                 else:
                     doc['type'] = 'original_post'
 
-                # Check if a document already exists
-                resp = document_view(index_name=INDEX, doc_id=doc['id'])
-                if not resp:
-                    _ = document_add(index_name=INDEX, doc=doc, doc_id=doc['id'])
-                    log.success(f'Successfully added! ID: {doc["id"]}, Type:{doc["type"]}')
-                else:
-                    log.info(f"Document already exist! ID: {doc['id']}")
+                docs.append(doc)
+
+    # Check which documents already exist in batches, then add only the new ones
+    existing_ids = existing_documents(index_name=INDEX, doc_ids=[doc['id'] for doc in docs])
+    log.info(f"{len(existing_ids)} of {len(docs)} documents already exist")
+    res = bulk_upsert(index_name=INDEX, docs=[doc for doc in docs if doc['id'] not in existing_ids])
+    for doc_id in res['created']:
+        log.success(f'Successfully added! ID: {doc_id}')
+    for failure in res['failed']:
+        log.error(f"Error: {failure['error']}, ID: {failure['id']}")
 
 
 if __name__ == "__main__":
@@ -13,7 +13,7 @@ from loguru import logger
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from common.elasticsearch_utils import document_view, document_add
+from common.elasticsearch_utils import bulk_index, document_hash, existing_documents
 
 load_dotenv()
 
@@ -620,11 +620,14 @@ def parse_dumps():
 
 
 def index_documents(docs):
-    new_docs = 0
-    existing_docs = 0
     threading_docs = 0
-    updated_docs = 0
-    
+    unchanged_docs = 0
+    changed_docs = []
+
+    for doc in docs:
+        doc['content_hash'] = document_hash(doc)
+    stored_hashes = existing_documents(index_name=INDEX_NAME, doc_ids=[doc['id'] for doc in docs])
+
     for doc in docs:
         # Check if document has threading data
         has_threading = any([
@@ -633,33 +636,36 @@ def index_documents(docs):
             doc.get('reply_to_author') is not None,
             doc.get('thread_depth') == 0  # Include root messages too
         ])
-        
+
         if has_threading:
             threading_docs += 1
 
-        resp = document_view(index_name=INDEX_NAME, doc_id=doc['id'])
-        if not resp:
-            # Process all new documents
-            _ = document_add(index_name=INDEX_NAME, doc=doc, doc_id=doc['id'])
-            new_docs += 1
-            
-            if has_threading and doc.get("thread_depth", 0) > 0:
-                logger.success(f'✅ Added: {doc.get("authors", ["Unknown"])[0]} (depth {doc.get("thread_depth", 0)})')
+        # Only write documents that are new or whose content changed
+        if stored_hashes.get(doc['id']) == doc['content_hash']:
+            unchanged_docs += 1
         else:
-            existing_docs += 1
-            
-            # Update the existing document with new threading fields
-            _ = document_add(index_name=INDEX_NAME, doc=doc, doc_id=doc['id'])
-            updated_docs += 1
-            
-            if has_threading and doc.get("thread_depth", 0) > 0:
-                logger.success(f'✅ Updated: {doc.get("authors", ["Unknown"])[0]} (depth {doc.get("thread_depth", 0)})')
-    
+            changed_docs.append(doc)
+
+    # Changed documents replace the stored ones, dropping fields they no longer have
+    res = bulk_index(index_name=INDEX_NAME, docs=changed_docs)
+    for failure in res['failed']:
+        logger.error(f"Error: {failure['error']}, ID-{failure['id']}")
+    new_docs = len(res['created'])
+    updated_docs = len(res['updated'])
+    existing_docs = len(stored_hashes)
+
+    for doc in changed_docs:
+        if doc.get("thread_depth", 0) > 0 and doc['id'] in res['created']:
+            logger.success(f'✅ Added: {doc.get("authors", ["Unknown"])[0]} (depth {doc.get("thread_depth", 0)})')
+        elif doc.get("thread_depth", 0) > 0 and doc['id'] in res['updated']:
+            logger.success(f'✅ Updated: {doc.get("authors", ["Unknown"])[0]} (depth {doc.get("thread_depth", 0)})')
+
     logger.success("📊 INDEXING SUMMARY:")
     logger.success(f"    📝 Total documents processed: {len(docs)}")
     logger.success(f"    ✅ New documents added: {new_docs}")
     logger.success(f"    📄 Existing documents: {existing_docs}")
     logger.success(f"    🔄 Documents updated: {updated_docs}")
+    logger.success(f"    ⏭️ Unchanged documents skipped: {unchanged_docs}")
     logger.success(f"    🧵 Documents with threading data: {threading_docs}")
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import click
 from twisted.internet import asyncioreactor, defer
 from twisted.internet.task import react
@@ -6,6 +7,7 @@ from loguru import logger
 from scraper.commands.elastic import elastic
 from scraper.commands.scrapy import scrapy
 from scraper.commands.github import github
+from scraper.commands.local import local
 from scraper.config import settings
 from scraper.scraper_factory import ScraperFactory
 
@@ -26,11 +28,17 @@ def cli():
 cli.add_command(scrapy)
 cli.add_command(github)
 cli.add_command(elastic)
+cli.add_command(local)
 
 
 def run_in_reactor(coro):
-    """Bridge between coroutines and Twisted's deferred system."""
-    return defer.ensureDeferred(coro)
+    """
+    Bridge between coroutines and Twisted's deferred system.
+
+    The coroutine runs as an asyncio task on the reactor's event loop, so it can
+    await asyncio-native code (async clients, background flush tasks, sleeps).
+    """
+    return defer.Deferred.fromFuture(asyncio.ensure_future(coro))
 
 
 @cli.command()
@@ -38,8 +46,9 @@ def run_in_reactor(coro):
 @click.option(
     "--output",
     type=click.Choice(settings.registered_output_types),
-    default="elasticsearch",
-    help="Where to send the scraped data",
+    default=["elasticsearch"],
+    multiple=True,
+    help="Where to send the scraped data. Repeat to write to several outputs in one pass",
 )
 def scrape(source, output):
     """
@@ -47,11 +56,12 @@ def scrape(source, output):
 
     If --source is provided, scrapes only that source. Otherwise, scrapes all
     sources defined in sources.yaml. The scraped data is sent to the specified
-    output (elasticsearch by default).
+    outputs (elasticsearch by default).
 
     Example usage:
     $ scraper scrape --source bitcointalk
     $ scraper scrape  # scrapes all sources
+    $ scraper scrape --source bips --output elasticsearch --output parquet
     """
     try:
         asyncioreactor.install()
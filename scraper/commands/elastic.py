@@ -1,16 +1,59 @@
+import asyncio
 from datetime import datetime
 import click
+import io
 import json
+import time
 from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+from elasticsearch import NotFoundError
+from elasticsearch.helpers import parallel_bulk
 from twisted.internet.task import react
 from twisted.internet import defer
 
+from scraper.config import get_project_root, settings
+from scraper.models import SourceConfig
 from scraper.outputs import ElasticsearchOutput
+from scraper.outputs.elasticsearch_mapping import generated_mappings
+from scraper.outputs.dead_letter import SpooledDocument, default_spool_dir, read_spool
+from scraper.outputs.jsonl import JsonlWriter, jsonl_paths, open_compressed
+from scraper.utils import normalize_domain
 
 
 def run_in_reactor(coro):
-    """Bridge between coroutines and Twisted's deferred system."""
-    return defer.ensureDeferred(coro)
+    """
+    Bridge between coroutines and Twisted's deferred system.
+
+    The coroutine runs as an asyncio task on the reactor's event loop, so it can
+    await asyncio-native code (async clients, background flush tasks, sleeps).
+    """
+    return defer.Deferred.fromFuture(asyncio.ensure_future(coro))
+
+
+async def wait_for_task(es, task_id: str, poll_interval: float = 2.0) -> dict:
+    """
+    Poll a background task (delete/update by query, reindex) until it
+    completes, showing its progress, and return the task's response.
+    """
+    while True:
+        task = es.tasks.get(task_id=task_id)
+        if task["completed"]:
+            if "error" in task:
+                raise click.ClickException(
+                    f"Task {task_id} failed: {task['error'].get('reason')}"
+                )
+            click.echo()
+            return task["response"]
+
+        status = task["task"]["status"]
+        done = sum(status.get(key, 0) for key in ("created", "updated", "deleted", "noops"))
+        percent = f" ({done / status['total']:.0%})" if status.get("total") else ""
+        click.echo(
+            f"\r{done}/{status.get('total', 0)} documents processed{percent}, "
+            f"{status.get('version_conflicts', 0)} conflicts",
+            nl=False,
+        )
+        await asyncio.sleep(poll_interval)
 
 
 @click.group()
@@ -67,6 +110,44 @@ def init_index(index_name: str, mapping_file: Path, force: bool):
     react(run_init)
 
 
+def source_filter(source: SourceConfig, legacy: bool = True) -> dict:
+    """
+    Query matching the documents and runs of a source by its `source` name.
+
+    Runs recorded in the documents index by earlier versions are matched on
+    `source.keyword`. With `legacy`, documents indexed before documents had a
+    `source` are matched by the domain the scraper stores, unless another
+    source shares that domain and they cannot be told apart.
+    """
+    should = [
+        {"term": {"source": source.name}},
+        {"term": {"source.keyword": source.name}},
+    ]
+    if legacy:
+        domain = normalize_domain(source.domain)
+        shared = [
+            other.name
+            for sources in settings.load_sources().values()
+            for other in sources
+            if other.name != source.name and normalize_domain(other.domain) == domain
+        ]
+        if shared:
+            click.echo(
+                f"Documents of {source.name} indexed without a source name are kept: "
+                f"its domain {domain} is shared with {', '.join(shared)}"
+            )
+        else:
+            should.append(
+                {
+                    "bool": {
+                        "must": [{"term": {"domain.keyword": domain}}],
+                        "must_not": [{"exists": {"field": "source"}}],
+                    }
+                }
+            )
+    return {"bool": {"should": should, "minimum_should_match": 1}}
+
+
 @elastic.command()
 @click.argument("index_name")
 @click.option(
@@ -74,15 +155,39 @@ def init_index(index_name: str, mapping_file: Path, force: bool):
     is_flag=True,
     help="Remove only documents marked as test_document=True",
 )
-def cleanup_index(index_name: str, test_docs_only: bool):
+@click.option(
+    "--by-source",
+    "source_name",
+    help="Remove only the documents (and runs) of this source from sources.yaml",
+)
+@click.option(
+    "--requests-per-second",
+    type=float,
+    default=-1,
+    help="Throttle the deletion to this many documents per second (default: unthrottled)",
+)
+@click.option(
+    "--poll-interval", default=2.0, help="Seconds between progress updates"
+)
+def cleanup_index(
+    index_name: str,
+    test_docs_only: bool,
+    source_name: str,
+    requests_per_second: float,
+    poll_interval: float,
+):
     """
     Remove documents from the specified Elasticsearch index.
 
-    By default removes all documents. Use --test-docs-only to remove only test documents.
+    By default removes all documents. Use --test-docs-only to remove only test
+    documents, and --by-source to remove only one source's documents. The
+    deletion runs as a sliced background task whose progress is reported
+    until it completes; pressing Ctrl-C cancels it.
 
     Example usage:
     $ scraper elastic cleanup-index my_index
     $ scraper elastic cleanup-index my_index --test-docs-only
+    $ scraper elastic cleanup-index my_index --by-source BIPs --requests-per-second 500
     """
     try:
         from twisted.internet import asyncioreactor
@@ -91,6 +196,23 @@ def cleanup_index(index_name: str, test_docs_only: bool):
     except Exception:
         pass
 
+    filters = []
+    operation_desc = "documents"
+    if test_docs_only:
+        filters.append({"term": {"test_document": True}})
+        operation_desc = "test documents"
+    if source_name:
+        source = settings.get_source_config(source_name)
+        if source is None:
+            raise click.ClickException(f"Source {source_name} not found in sources.yaml")
+        filters.append(source_filter(source))
+        operation_desc = f"{operation_desc} of {source.name}"
+    query = (
+        {"query": {"bool": {"filter": filters}}}
+        if filters
+        else {"query": {"match_all": {}}}
+    )
+
     def run_cleanup(reactor):
         output = ElasticsearchOutput(index_name=index_name)
 
@@ -100,14 +222,6 @@ def cleanup_index(index_name: str, test_docs_only: bool):
                     click.echo(f"Index {index_name} does not exist")
                     return
 
-                # Define query based on the cleanup type
-                if test_docs_only:
-                    query = {"query": {"term": {"test_document": True}}}
-                    operation_desc = "test documents"
-                else:
-                    query = {"query": {"match_all": {}}}
-                    operation_desc = "documents"
-
                 try:
                     # First count how many documents will be affected
                     count_result = output.es.count(index=index_name, body=query)
@@ -120,10 +234,31 @@ def cleanup_index(index_name: str, test_docs_only: bool):
                         click.echo("Operation cancelled")
                         return
 
-                    # Proceed with deletion
-                    delete_result = output.es.delete_by_query(
-                        index=index_name, body=query
+                    # Proceed with deletion as a background task
+                    task_id = output.es.delete_by_query(
+                        index=index_name,
+                        body=query,
+                        slices="auto",
+                        conflicts="proceed",
+                        requests_per_second=requests_per_second,
+                        wait_for_completion=False,
+                    )["task"]
+                    click.echo(f"Started deletion task {task_id}")
+
+                    def cancel_task():
+                        click.echo(f"\nCancelling deletion task {task_id}...")
+                        output.es.tasks.cancel(task_id=task_id)
+
+                    # Ctrl-C stops the reactor; make sure the task stops with it
+                    trigger = reactor.addSystemEventTrigger(
+                        "before", "shutdown", cancel_task
                     )
+                    try:
+                        delete_result = await wait_for_task(
+                            output.es, task_id, poll_interval
+                        )
+                    finally:
+                        reactor.removeSystemEventTrigger(trigger)
 
                     # Print detailed deletion results
                     click.echo("\nDeletion Results:")
@@ -131,16 +266,29 @@ def cleanup_index(index_name: str, test_docs_only: bool):
                         f"Total {operation_desc} deleted: {delete_result['deleted']}"
                     )
                     click.echo(f"Total batches: {delete_result['batches']}")
-                    click.echo(f"Documents that failed: {delete_result['failures']}")
+                    click.echo(
+                        f"Version conflicts: {delete_result['version_conflicts']}"
+                    )
+                    click.echo(f"Documents that failed: {len(delete_result['failures'])}")
                     click.echo(f"Time taken: {delete_result['took']}ms")
 
                     if delete_result.get("failures"):
                         click.echo("\nFailures encountered:")
                         for failure in delete_result["failures"]:
-                            click.echo(f"Document ID: {failure['_id']}")
-                            click.echo(f"Error: {failure.get('error')}")
+                            click.echo(f"Document ID: {failure.get('id')}")
+                            click.echo(f"Error: {failure.get('cause')}")
                             click.echo("---")
 
+                    if source_name:
+                        runs_result = output.es.delete_by_query(
+                            index=output.runs_index,
+                            body={"query": source_filter(source, legacy=False)},
+                            ignore_unavailable=True,
+                        )
+                        click.echo(
+                            f"Runs deleted from {output.runs_index}: {runs_result['deleted']}"
+                        )
+
                 except Exception as e:
                     click.echo(f"Error during cleanup: {e}", err=True)
                     raise click.ClickException(str(e))
@@ -150,6 +298,234 @@ def cleanup_index(index_name: str, test_docs_only: bool):
     react(run_cleanup)
 
 
+@elastic.command()
+@click.argument("alias")
+@click.option(
+    "--mapping",
+    "mapping_file",
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+    help="Mapping file of the new index",
+)
+@click.option(
+    "--requests-per-second",
+    type=float,
+    default=-1,
+    help="Throttle the copy to this many documents per second (default: unthrottled)",
+)
+@click.option(
+    "--poll-interval", default=5.0, help="Seconds between progress updates"
+)
+@click.option(
+    "--delete-old", is_flag=True, help="Delete the previous index after the swap"
+)
+def reindex(
+    alias: str,
+    mapping_file: Path,
+    requests_per_second: float,
+    poll_interval: float,
+    delete_old: bool,
+):
+    """
+    Move an index to a new mapping without downtime or re-scraping.
+
+    Creates a new versioned index (<alias>_<timestamp>) with the given
+    mapping, copies the documents with a sliced server-side reindex, restores
+    the replica and refresh settings, and then atomically points ALIAS at the
+    new index. Searches keep hitting the previous index until the swap. If
+    ALIAS is still a concrete index, it is replaced by an alias of the same
+    name in the same atomic step.
+
+    Pause scrapers writing to ALIAS while reindexing; documents written
+    during the copy are not carried over.
+
+    Example usage:
+    $ scraper elastic reindex my_index --mapping mappings/github_metadata.json
+    $ scraper elastic reindex my_index --mapping mappings/github_metadata.json --delete-old
+    """
+    try:
+        from twisted.internet import asyncioreactor
+
+        asyncioreactor.install()
+    except Exception:
+        pass
+
+    try:
+        with open(mapping_file) as f:
+            mapping = json.load(f)
+    except json.JSONDecodeError:
+        raise click.ClickException(f"Invalid JSON in mapping file: {mapping_file}")
+
+    def run_reindex(reactor):
+        output = ElasticsearchOutput(index_name=alias)
+
+        async def reindex_alias():
+            async with output:
+                es = output.es
+                if es.indices.exists_alias(name=alias):
+                    indices = list(es.indices.get_alias(name=alias))
+                    if len(indices) != 1:
+                        raise click.ClickException(
+                            f"Alias {alias} points to {len(indices)} indices: {indices}"
+                        )
+                    old_index, is_alias = indices[0], True
+                elif es.indices.exists(index=alias):
+                    old_index, is_alias = alias, False
+                else:
+                    raise click.ClickException(f"Index {alias} does not exist")
+
+                new_index = f"{alias}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                index_settings = mapping.get("settings", {})
+                final_settings = {
+                    "refresh_interval": index_settings.get(
+                        "refresh_interval",
+                        index_settings.get("index", {}).get("refresh_interval"),
+                    ),
+                    "number_of_replicas": es.indices.get_settings(
+                        index=old_index, name="index.number_of_replicas"
+                    )[old_index]["settings"]["index"]["number_of_replicas"],
+                }
+
+                # No refreshes and no replicas while copying, restored afterwards
+                await output.create_index_with_mapping(
+                    new_index,
+                    {
+                        **mapping,
+                        "settings": {
+                            **index_settings,
+                            "refresh_interval": "-1",
+                            "number_of_replicas": 0,
+                        },
+                    },
+                )
+                click.echo(f"Created index {new_index}, copying {old_index}...")
+
+                try:
+                    task_id = es.reindex(
+                        body={
+                            "source": {"index": old_index},
+                            "dest": {"index": new_index},
+                        },
+                        slices="auto",
+                        requests_per_second=requests_per_second,
+                        wait_for_completion=False,
+                    )["task"]
+
+                    def cancel_task():
+                        click.echo(f"\nCancelling reindex task {task_id}...")
+                        es.tasks.cancel(task_id=task_id)
+
+                    # Ctrl-C stops the reactor; make sure the task stops with it
+                    trigger = reactor.addSystemEventTrigger(
+                        "before", "shutdown", cancel_task
+                    )
+                    try:
+                        result = await wait_for_task(es, task_id, poll_interval)
+                    finally:
+                        reactor.removeSystemEventTrigger(trigger)
+
+                    if result.get("failures"):
+                        raise click.ClickException(
+                            f"{len(result['failures'])} documents failed to copy, "
+                            f"first failure: {result['failures'][0]}"
+                        )
+
+                    es.indices.put_settings(index=new_index, body=final_settings)
+                    es.indices.refresh(index=new_index)
+                except BaseException:
+                    click.echo(
+                        f"Reindex failed, deleting {new_index}; {alias} is unchanged",
+                        err=True,
+                    )
+                    es.indices.delete(index=new_index)
+                    raise
+
+                old_count = es.count(index=old_index)["count"]
+                new_count = es.count(index=new_index)["count"]
+                click.echo(
+                    f"Copied {new_count}/{old_count} documents in {result['took']}ms"
+                )
+
+                if not is_alias and not click.confirm(
+                    f"{alias} is a concrete index and will be deleted to be replaced "
+                    f"by an alias to {new_index}. Do you want to continue?"
+                ):
+                    click.echo(f"Swap cancelled, {new_index} is kept")
+                    return
+
+                # Swap atomically: searches see either the old or the new index
+                es.indices.update_aliases(
+                    body={
+                        "actions": [
+                            {"remove": {"index": old_index, "alias": alias}}
+                            if is_alias
+                            else {"remove_index": {"index": old_index}},
+                            {"add": {"index": new_index, "alias": alias}},
+                        ]
+                    }
+                )
+                click.echo(f"Alias {alias} now points to {new_index}")
+
+                if not is_alias:
+                    click.echo(f"Deleted concrete index {old_index}")
+                elif delete_old:
+                    es.indices.delete(index=old_index)
+                    click.echo(f"Deleted previous index {old_index}")
+                else:
+                    click.echo(f"Previous index {old_index} kept for rollback")
+
+        return run_in_reactor(reindex_alias())
+
+    react(run_reindex)
+
+
+@elastic.command()
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path(get_project_root()) / "mappings",
+    show_default=True,
+    help="Directory the mapping files are written to",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Only report mapping files that are out of date with the models",
+)
+def generate_mappings(output_dir: Path, check: bool):
+    """
+    Generate index mappings from the document models.
+
+    Field types are derived from the pydantic models in scraper/models and
+    their `es_mapping` hints, so identifiers are keywords, raw originals and
+    diff hunks are stored without being indexed, embeddings are dense vectors
+    and GitHub reviews are nested. Use the generated files with init-index or
+    reindex.
+
+    Example usage:
+    $ scraper elastic generate-mappings
+    $ scraper elastic init-index my_index mappings/documents.json
+    """
+    outdated = []
+    for file_name, mapping in generated_mappings().items():
+        path = output_dir / file_name
+        content = json.dumps(mapping, indent=2) + "\n"
+        if path.exists() and path.read_text() == content:
+            continue
+        outdated.append(path)
+        if not check:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+            click.echo(f"Wrote {path}")
+
+    if check and outdated:
+        raise click.ClickException(
+            f"Out of date: {', '.join(str(path) for path in outdated)}"
+        )
+    if not outdated:
+        click.echo("Mappings are up to date")
+
+
 @elastic.command()
 @click.argument("index_name")
 def show_mapping(index_name: str):
@@ -207,7 +583,11 @@ def show_runs(index_name: str, source: str, limit: int):
             output = ElasticsearchOutput(index_name=index_name)
 
             async with output:
-                runs = await output.get_recent_runs(source, limit)
+                # Runs are recorded under the exact name from sources.yaml
+                source_config = settings.get_source_config(source)
+                runs = await output.get_recent_runs(
+                    source_config.name if source_config else source, limit
+                )
 
                 if not runs:
                     click.echo(f"No runs found for source: {source}")
@@ -238,9 +618,355 @@ def show_runs(index_name: str, source: str, limit: int):
                             f"Resources to process: {run.stats.resources_to_process}"
                         )
                         click.echo(f"Documents indexed: {run.stats.documents_indexed}")
+                        if run.stats.documents_failed:
+                            click.echo(
+                                f"Documents failed: {run.stats.documents_failed}"
+                            )
+                        if run.stats.documents_skipped:
+                            click.echo(
+                                f"Documents unchanged: {run.stats.documents_skipped}"
+                            )
                     if run.last_commit_hash:
                         click.echo(f"Last commit: {run.last_commit_hash[:8]}")
 
         return run_in_reactor(show())
 
     react(run_show)
+
+
+@elastic.command()
+@click.argument(
+    "spool_path", required=False, type=click.Path(exists=True, path_type=Path)
+)
+@click.option("--index", "index_name", help="Replay into this index instead")
+@click.option("--batch-size", default=1000, help="Documents per bulk request")
+@click.option("--keep", is_flag=True, help="Keep spool files after replaying them")
+def replay(spool_path: Path, index_name: str, batch_size: int, keep: bool):
+    """
+    Re-index documents spooled after failed writes.
+
+    SPOOL_PATH is a spool file or directory (defaults to the dead letter
+    directory). Documents are bulk indexed into the index they were meant for,
+    unless --index is given. Replayed files are removed; documents that fail
+    again are spooled to a new file.
+
+    Example usage:
+    $ scraper elastic replay
+    $ scraper elastic replay data/dead_letter/my_index.elasticsearchoutput.20240101_120000.jsonl.gz
+    $ scraper elastic replay --index my_index_v2 --batch-size 5000
+    """
+    try:
+        from twisted.internet import asyncioreactor
+
+        asyncioreactor.install()
+    except Exception:
+        pass
+
+    paths = jsonl_paths(spool_path or default_spool_dir())
+    if not paths:
+        click.echo("No spooled documents to replay")
+        return
+
+    def run_replay(reactor):
+        async def replay_documents():
+            outputs = {}
+            try:
+                for path in paths:
+                    for record in read_spool(path):
+                        target = index_name or record["index"]
+                        if target not in outputs:
+                            outputs[target] = ElasticsearchOutput(
+                                index_name=target,
+                                batch_size=batch_size,
+                                max_batch_bytes=50 * 1024 * 1024,
+                            )
+                            await outputs[target].__aenter__()
+                        await outputs[target].index_document(
+                            SpooledDocument(**record["document"])
+                        )
+            finally:
+                for output in outputs.values():
+                    await output.__aexit__(None, None, None)
+
+            for target, output in outputs.items():
+                click.echo(
+                    f"{target}: {output.dead_letter.count} failed again, "
+                    f"{output.documents_skipped} already up to date"
+                )
+            if not keep:
+                for path in paths:
+                    path.unlink()
+                click.echo(f"Removed {len(paths)} replayed spool files")
+
+        return run_in_reactor(replay_documents())
+
+    react(run_replay)
+
+
+def throughput(documents: int, size: int, seconds: float) -> str:
+    """Format a transfer rate in documents and (uncompressed) megabytes per second."""
+    seconds = max(seconds, 1e-6)
+    return (
+        f"{documents} documents, {size / 1024 / 1024:.1f} MB in {seconds:.1f}s "
+        f"({documents / seconds:.0f} docs/s, {size / 1024 / 1024 / seconds:.2f} MB/s)"
+    )
+
+
+def export_slice(
+    es,
+    pit_ids: Dict[int, str],
+    slice_id: int,
+    slices: int,
+    writer: JsonlWriter,
+    page_size: int,
+) -> Tuple[int, int]:
+    """
+    Page through one slice of a point in time and write its documents.
+
+    Each search may return a new point in time id, which the next page uses
+    and which is kept in `pit_ids[slice_id]` for the caller to close.
+
+    Returns the number of documents and uncompressed bytes written.
+    """
+    documents = size = 0
+    search_after = None
+    while True:
+        body = {
+            "pit": {"id": pit_ids[slice_id], "keep_alive": "5m"},
+            "sort": ["_shard_doc"],
+            "size": page_size,
+        }
+        # A single worker reads the whole point in time unsliced
+        if slices > 1:
+            body["slice"] = {"id": slice_id, "max": slices}
+        if search_after:
+            body["search_after"] = search_after
+        response = es.search(body=body)
+        pit_ids[slice_id] = response.get("pit_id", pit_ids[slice_id])
+        hits = response["hits"]["hits"]
+        if not hits:
+            return documents, size
+
+        lines = [
+            json.dumps({"_id": hit["_id"], "_source": hit["_source"]}).encode("utf-8")
+            for hit in hits
+        ]
+        writer.write_lines(lines)
+        documents += len(lines)
+        size += sum(len(line) + 1 for line in lines)
+        search_after = hits[-1]["sort"]
+
+
+@elastic.command()
+@click.argument("index_name")
+@click.argument("output_dir", type=click.Path(file_okay=False, path_type=Path))
+@click.option("--workers", default=4, help="Number of slices exported in parallel")
+@click.option("--page-size", default=1000, help="Documents fetched per request")
+@click.option(
+    "--compression",
+    type=click.Choice(["gzip", "zstd", "none"]),
+    default="gzip",
+    help="Compression of the NDJSON shards",
+)
+@click.option(
+    "--max-file-mb", default=0, help="Rotate shards after this many MB (0: never)"
+)
+def export(
+    index_name: str,
+    output_dir: Path,
+    workers: int,
+    page_size: int,
+    compression: str,
+    max_file_mb: int,
+):
+    """
+    Export an index to compressed NDJSON shards.
+
+    Documents are read from a point in time, so the export is consistent even
+    while the index is being written, with one sliced search per worker. Each
+    worker writes its own shard (<index>.<slice>.jsonl.gz) of `_id`/`_source`
+    records; the index mapping is saved next to them as <index>.mapping.json.
+
+    Example usage:
+    $ scraper elastic export my_index snapshots/my_index
+    $ scraper elastic export my_index snapshots/my_index --workers 8 --compression zstd
+    """
+    try:
+        from twisted.internet import asyncioreactor
+
+        asyncioreactor.install()
+    except Exception:
+        pass
+
+    compression = None if compression == "none" else compression
+
+    def run_export(reactor):
+        async def export_index():
+            output = ElasticsearchOutput(index_name=index_name)
+
+            async with output:
+                es = output.es
+                if not es.indices.exists(index=index_name):
+                    raise click.ClickException(f"Index {index_name} does not exist")
+
+                output_dir.mkdir(parents=True, exist_ok=True)
+                mapping = next(iter(es.indices.get_mapping(index=index_name).values()))
+                (output_dir / f"{index_name}.mapping.json").write_text(
+                    json.dumps(mapping, indent=2)
+                )
+
+                pit_id = es.open_point_in_time(index=index_name, keep_alive="5m")["id"]
+                # Latest point in time id of each slice
+                pit_ids = {slice_id: pit_id for slice_id in range(workers)}
+                writers = [
+                    JsonlWriter(
+                        output_dir / f"{index_name}.{slice_id:03d}",
+                        compression=compression,
+                        max_file_bytes=max_file_mb * 1024 * 1024 or None,
+                    )
+                    for slice_id in range(workers)
+                ]
+                started = time.monotonic()
+                try:
+                    results = await asyncio.gather(
+                        *(
+                            asyncio.to_thread(
+                                export_slice,
+                                es,
+                                pit_ids,
+                                slice_id,
+                                workers,
+                                writer,
+                                page_size,
+                            )
+                            for slice_id, writer in enumerate(writers)
+                        )
+                    )
+                finally:
+                    for writer in writers:
+                        writer.close()
+                    for latest_id in set(pit_ids.values()):
+                        try:
+                            es.close_point_in_time(id=latest_id)
+                        except NotFoundError:
+                            # Already closed through another id of the same point in time
+                            pass
+
+                documents = sum(docs for docs, _ in results)
+                size = sum(size for _, size in results)
+                shards = sum(len(writer.paths) for writer in writers)
+                click.echo(
+                    f"Exported {throughput(documents, size, time.monotonic() - started)} "
+                    f"to {shards} shards in {output_dir}"
+                )
+
+        return run_in_reactor(export_index())
+
+    react(run_export)
+
+
+def read_shards(paths: List[Path], counters: Dict[str, int]) -> Iterator[dict]:
+    """Yield the exported records of NDJSON shards, counting bytes read."""
+    for path in paths:
+        with open_compressed(path, "rb") as raw:
+            for line in io.BufferedReader(raw):
+                if line.strip():
+                    counters["bytes"] += len(line)
+                    yield json.loads(line)
+
+
+@elastic.command(name="import")
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument("index_name")
+@click.option("--workers", default=4, help="Number of bulk requests sent in parallel")
+@click.option("--chunk-size", default=1000, help="Documents per bulk request")
+@click.option(
+    "--max-chunk-mb", default=10, help="Maximum size of a bulk request in MB"
+)
+def import_index(
+    input_dir: Path, index_name: str, workers: int, chunk_size: int, max_chunk_mb: int
+):
+    """
+    Bulk load NDJSON shards written by `export` into an index.
+
+    If the index does not exist, it is created with the exported mapping and
+    its refreshes and replicas are paused while loading, then restored. An
+    existing index is only tuned that way with `bulk_load_mode = True`.
+
+    Example usage:
+    $ scraper elastic import snapshots/my_index my_index_copy
+    $ scraper elastic import snapshots/my_index my_index_copy --workers 8
+    """
+    try:
+        from twisted.internet import asyncioreactor
+
+        asyncioreactor.install()
+    except Exception:
+        pass
+
+    paths = jsonl_paths(input_dir)
+    if not paths:
+        raise click.ClickException(f"No NDJSON shards found in {input_dir}")
+
+    def run_import(reactor):
+        async def import_shards():
+            output = ElasticsearchOutput(index_name=index_name)
+
+            async with output:
+                es = output.es
+                if not es.indices.exists(index=index_name):
+                    mapping_files = sorted(input_dir.glob("*.mapping.json"))
+                    mapping = (
+                        json.loads(mapping_files[0].read_text()) if mapping_files else {}
+                    )
+                    await output.create_index_with_mapping(index_name, mapping)
+                    click.echo(f"Created index {index_name}")
+                    # Nothing else writes to an index this import just created
+                    output.bulk_load_mode = True
+
+                await output.start_bulk_load()
+                counters = {"bytes": 0}
+                documents = 0
+                failures = []
+
+                def load():
+                    nonlocal documents
+                    actions = (
+                        {
+                            "_index": index_name,
+                            "_id": record["_id"],
+                            "_source": record["_source"],
+                        }
+                        for record in read_shards(paths, counters)
+                    )
+                    for ok, item in parallel_bulk(
+                        es,
+                        actions,
+                        thread_count=workers,
+                        chunk_size=chunk_size,
+                        max_chunk_bytes=max_chunk_mb * 1024 * 1024,
+                        raise_on_error=False,
+                        raise_on_exception=False,
+                    ):
+                        if ok:
+                            documents += 1
+                        else:
+                            failures.append(item)
+
+                started = time.monotonic()
+                try:
+                    await asyncio.to_thread(load)
+                finally:
+                    await output.end_bulk_load()
+
+                click.echo(
+                    f"Imported {throughput(documents, counters['bytes'], time.monotonic() - started)} "
+                    f"into {index_name} from {len(paths)} shards"
+                )
+                if failures:
+                    click.echo(f"{len(failures)} documents failed, first failure:")
+                    click.echo(json.dumps(failures[0], default=str))
+
+        return run_in_reactor(import_shards())
+
+    react(run_import)
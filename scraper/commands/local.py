@@ -0,0 +1,62 @@
+import click
+import sqlite3
+from pathlib import Path
+
+from scraper.config import settings
+from scraper.outputs.sqlite_output import connect, default_database_path, search_documents
+
+
+@click.group()
+def local():
+    """Commands for working with the local SQLite output."""
+    pass
+
+
+@local.command()
+@click.argument("query")
+@click.option(
+    "--db",
+    "database",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="SQLite file to search. Defaults to the file used by the sqlite output",
+)
+@click.option("--limit", default=10, help="Number of results to show")
+def search(query: str, database: Path, limit: int):
+    """
+    Search documents written by the sqlite output, ranked by BM25.
+
+    QUERY uses SQLite FTS5 syntax (AND/OR/NOT, "phrases", prefix*).
+
+    Example usage:
+    $ scraper scrape --source bips --output sqlite
+    $ scraper local search "taproot AND schnorr"
+    $ scraper local search "authors:wuille" --limit 5
+    """
+    path = database or Path(default_database_path(settings.DEFAULT_INDEX))
+    if not path.exists():
+        raise click.ClickException(
+            f"Database {path} not found. Scrape with --output sqlite first."
+        )
+
+    conn = connect(str(path))
+    try:
+        results = search_documents(conn, query, limit)
+    except sqlite3.OperationalError as e:
+        raise click.ClickException(f"Invalid search query: {e}")
+    finally:
+        conn.close()
+
+    if not results:
+        click.echo(f"No documents match: {query}")
+        return
+
+    for result in results:
+        click.echo("\n" + "-" * 40)
+        # bm25() is lower-is-better, flip it for display
+        click.echo(f"{result['title']}  (score: {-result['score']:.2f})")
+        click.echo(result["url"])
+        if result["authors"]:
+            click.echo(f"Authors: {result['authors']}")
+        if result["created_at"]:
+            click.echo(f"Created: {result['created_at']}")
+        click.echo(result["snippet"])
@@ -1,6 +1,8 @@
 from .source import SourceConfig, AnalyzerConfig
 from .documents import (
     ScrapedDocument,
+    IndexingFailure,
+    BulkLoadStats,
     RunStats,
     ScraperRunDocument,
     BitcoinTranscriptDocument,
@@ -11,6 +13,8 @@ __all__ = [
     "AnalyzerConfig",
     "ScrapedDocument",
     "BitcoinTranscriptDocument",
+    "IndexingFailure",
+    "BulkLoadStats",
     "RunStats",
     "ScraperRunDocument",
 ]
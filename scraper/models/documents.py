@@ -1,15 +1,31 @@
+import hashlib
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import ClassVar, List, Optional, Set
 from datetime import datetime
 
+# Elasticsearch mapping hints for model fields, read by
+# scraper.outputs.elasticsearch_mapping. Fields without a hint get the default
+# mapping for their type (strings are mapped as text with a keyword subfield).
+KEYWORD = {"es_mapping": {"type": "keyword"}}
+TEXT = {"es_mapping": {"type": "text"}}
+DATE = {"es_mapping": {"type": "date"}}
+# Kept in _source only: returned with the document but not searchable
+NOT_INDEXED = {"es_mapping": {"type": "text", "index": False}}
+NESTED = {"es_mapping": {"type": "nested"}}
+DENSE_VECTOR = {"es_mapping": {"type": "dense_vector", "similarity": "cosine"}}
+
 
 class OriginalContent(BaseModel):
     """Represents the original content before markdown conversion"""
 
     format: str = Field(
-        description="Original format of the content (e.g., 'mediawiki', 'html')"
+        description="Original format of the content (e.g., 'mediawiki', 'html')",
+        json_schema_extra=KEYWORD,
+    )
+    body: str = Field(
+        description="Original content in its native format",
+        json_schema_extra=NOT_INDEXED,
     )
-    body: str = Field(description="Original content in its native format")
 
 
 class ScrapedDocument(BaseModel):
@@ -20,31 +36,55 @@ class ScrapedDocument(BaseModel):
     in every scraped document. It uses Pydantic for data validation and serialization.
     """
 
-    id: str = Field(description="Unique identifier for the document")
+    # Fields that change on every run without the content changing
+    VOLATILE_FIELDS: ClassVar[Set[str]] = {"indexed_at", "content_hash"}
+
+    id: str = Field(
+        description="Unique identifier for the document", json_schema_extra=KEYWORD
+    )
     title: str = Field(description="Title of the document")
-    body: str = Field(description="Main content of the document in markdown format")
+    body: str = Field(
+        description="Main content of the document in markdown format",
+        json_schema_extra=TEXT,
+    )
     original: Optional[OriginalContent] = Field(
         default=None, description="Original content before markdown conversion"
     )
-    summary: Optional[str] = Field(default=None, description="Summary of the document")
+    summary: Optional[str] = Field(
+        default=None, description="Summary of the document", json_schema_extra=TEXT
+    )
     summary_vector_embeddings: Optional[List[float]] = Field(
-        default=None, description="Vector embeddings of the summary"
+        default=None,
+        description="Vector embeddings of the summary",
+        json_schema_extra=DENSE_VECTOR,
     )
     domain: str = Field(description="Domain from which the document was scraped")
+    source: Optional[str] = Field(
+        default=None,
+        description="Name of the source in sources.yaml the document was scraped from",
+        json_schema_extra=KEYWORD,
+    )
     indexed_at: str = Field(
         default_factory=datetime.now().isoformat,
         description="Timestamp of when the document was indexed",
+        json_schema_extra=DATE,
     )
     created_at: Optional[str] = Field(
-        default=None, description="Timestamp of when the document was created"
+        default=None,
+        description="Timestamp of when the document was created",
+        json_schema_extra=DATE,
     )
     url: str = Field(description="URL of the original document")
     thread_url: str = Field(
-        default=None, description="URL of the thread that contains the document"
+        default=None,
+        description="URL of the thread that contains the document",
+        json_schema_extra=KEYWORD,
+    )
+    type: Optional[str] = Field(
+        default=None, description="Type of the document", json_schema_extra=KEYWORD
     )
-    type: Optional[str] = Field(default=None, description="Type of the document")
     language: Optional[str] = Field(
-        default=None, description="Language of the document"
+        default=None, description="Language of the document", json_schema_extra=KEYWORD
     )
     tags: Optional[List[str]] = Field(
         default=None, description="List of tags associated with the document"
@@ -61,19 +101,50 @@ class ScrapedDocument(BaseModel):
         default=0, description="Position in the thread chronologically"
     )
     parent_id: Optional[str] = Field(
-        default=None, description="ID of the parent message this is replying to"
+        default=None,
+        description="ID of the parent message this is replying to",
+        json_schema_extra=KEYWORD,
     )
     reply_to_author: Optional[str] = Field(
         default=None, description="Author of the message this is replying to"
     )
     anchor_id: Optional[str] = Field(
-        default=None, description="Anchor ID from the mailing list"
+        default=None,
+        description="Anchor ID from the mailing list",
+        json_schema_extra=KEYWORD,
     )
+    content_hash: Optional[str] = Field(
+        default=None,
+        description="Fingerprint of the document content, used to skip unchanged writes",
+        json_schema_extra={"es_mapping": {"type": "keyword", "index": False}},
+    )
+
+    def compute_content_hash(self) -> str:
+        """Return a stable SHA-256 fingerprint of the content, ignoring volatile fields."""
+        content = self.model_dump_json(exclude_none=True, exclude=self.VOLATILE_FIELDS)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def dump_json_with_content_hash(self) -> bytes:
+        """
+        Set `content_hash` and return the document as JSON, dumping it once.
+
+        The content is dumped without the volatile fields, hashed as in
+        compute_content_hash, and the volatile fields are then appended to
+        the same JSON object.
+        """
+        content = self.model_dump_json(exclude_none=True, exclude=self.VOLATILE_FIELDS)
+        self.content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        volatile = self.model_dump_json(exclude_none=True, include=self.VOLATILE_FIELDS)
+        if volatile != "{}":
+            content = f"{content[:-1]},{volatile[1:]}"
+        return content.encode("utf-8")
 
 
 class BitcoinTranscriptDocument(ScrapedDocument):
     media: Optional[str] = Field(
-        default=None, description="Media associated with the transcript"
+        default=None,
+        description="Media associated with the transcript",
+        json_schema_extra=KEYWORD,
     )
     transcript_by: Optional[str] = Field(
         default=None, description="Person or entity who transcribed the content"
@@ -88,6 +159,7 @@ class PRReviewClubDocument(ScrapedDocument):
     number: Optional[int] = Field(
         default_factory=None,
         description="Bitcoin Core PR number associated with the meeting",
+        json_schema_extra=KEYWORD,
     )
     host: Optional[str] = Field(
         default=None, description="The person hosting the meeting"
@@ -96,7 +168,23 @@ class PRReviewClubDocument(ScrapedDocument):
 
 class StackExchangeDocument(ScrapedDocument):
     accepted_answer_id: Optional[str] = Field(
-        default=None, description="ID of the accepted answer"
+        default=None, description="ID of the accepted answer", json_schema_extra=KEYWORD
+    )
+
+
+class IndexingFailure(BaseModel):
+    """A document that an output could not write, with the last error seen"""
+
+    document_id: str = Field(description="ID of the document that failed")
+    error_type: str = Field(description="Type of the error reported by the output")
+    reason: Optional[str] = Field(
+        default=None, description="Human readable reason for the failure"
+    )
+    status: Optional[int] = Field(
+        default=None, description="Status code reported for the failed write"
+    )
+    retries: int = Field(
+        default=0, description="Number of times the write was retried before giving up"
     )
 
 
@@ -109,28 +197,77 @@ class RunStats(BaseModel):
     documents_indexed: Optional[int] = Field(
         default=None, description="Number of documents successfully indexed in this run"
     )
+    documents_failed: Optional[int] = Field(
+        default=None, description="Number of documents that could not be indexed in this run"
+    )
+    documents_skipped: Optional[int] = Field(
+        default=None,
+        description="Number of documents not rewritten because their content was unchanged",
+    )
+    documents_failed_processing: Optional[int] = Field(
+        default=None,
+        description="Number of documents dropped because a processor failed on them",
+    )
+    documents_summarized: Optional[int] = Field(
+        default=None,
+        description="Number of summaries computed in this run (cached ones excluded)",
+    )
+    summarization_seconds: Optional[float] = Field(
+        default=None,
+        description="Seconds the summarization workers spent computing summaries",
+    )
+
+
+class BulkLoadStats(BaseModel):
+    """Index settings an output changed while bulk loading a backfill"""
+
+    refresh_interval: Optional[str] = Field(
+        default=None,
+        description="refresh_interval restored after the load (None: index default)",
+    )
+    number_of_replicas: Optional[str] = Field(
+        default=None, description="number_of_replicas restored after the load"
+    )
+    restored: bool = Field(
+        default=False, description="Whether the original settings were restored"
+    )
+    force_merge_task: Optional[str] = Field(
+        default=None, description="Id of the force merge task started after the load"
+    )
 
 
 class ScraperRunDocument(BaseModel):
     """Represents a single run of a scraper with its statistics"""
 
-    scraper: str = Field(description="Name of the scraper")
-    source: str = Field(description="Name of the source")
+    scraper: str = Field(description="Name of the scraper", json_schema_extra=KEYWORD)
+    source: str = Field(
+        description="Name of the source, as in sources.yaml",
+        json_schema_extra=KEYWORD,
+    )
     domain: str = Field(description="Domain being scraped")
-    started_at: str = Field(description="When this run started")
+    started_at: str = Field(description="When this run started", json_schema_extra=DATE)
     finished_at: str = Field(
         default_factory=lambda: datetime.now().isoformat(),
         description="When this run finished",
+        json_schema_extra=DATE,
     )
     type: str = Field(
         default="scraper_run",
         description="Type of the document, always 'scraper_run' for run documents",
+        json_schema_extra=KEYWORD,
     )
     last_commit_hash: Optional[str] = Field(
-        default=None, description="Last commit hash for Git-based scrapers"
+        default=None,
+        description="Last commit hash for Git-based scrapers",
+        json_schema_extra=KEYWORD,
     )
     success: bool = Field(description="Whether the run completed successfully")
     error_message: Optional[str] = Field(
-        default=None, description="Error message if the run failed"
+        default=None,
+        description="Error message if the run failed",
+        json_schema_extra=TEXT,
     )
     stats: RunStats = Field(description="Statistics for this run")
+    bulk_load: Optional[BulkLoadStats] = Field(
+        default=None, description="Bulk-load mode used for this run, if any"
+    )
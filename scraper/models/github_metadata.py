@@ -1,29 +1,47 @@
 from typing import List, Optional, Literal
 from pydantic import BaseModel, Field
 
-from scraper.models.documents import ScrapedDocument
+from scraper.models.documents import (
+    DATE,
+    KEYWORD,
+    NESTED,
+    NOT_INDEXED,
+    TEXT,
+    ScrapedDocument,
+)
 
 
 class Review(BaseModel):
     """Represents a formal code review on a pull request"""
 
     id: int = Field(description="Unique identifier for the review")
-    author: str = Field(description="Username of the reviewer")
+    author: str = Field(
+        description="Username of the reviewer", json_schema_extra=KEYWORD
+    )
     commit_id: str = Field(
-        description="The SHA of the commit to which the review applies"
+        description="The SHA of the commit to which the review applies",
+        json_schema_extra=KEYWORD,
+    )
+    submitted_at: str = Field(
+        description="When the review was submitted", json_schema_extra=DATE
     )
-    submitted_at: str = Field(description="When the review was submitted")
-    body: str = Field(description="The review's comment text")
+    body: str = Field(description="The review's comment text", json_schema_extra=TEXT)
 
 
 class ThreadComment(BaseModel):
     """Represents a comment in a review thread"""
 
     id: int = Field(description="Unique identifier for the comment")
-    author: str = Field(description="Username of the comment author")
-    created_at: str = Field(description="When the comment was created")
-    updated_at: str = Field(description="When the comment was last updated")
-    body: str = Field(description="The text of the comment")
+    author: str = Field(
+        description="Username of the comment author", json_schema_extra=KEYWORD
+    )
+    created_at: str = Field(
+        description="When the comment was created", json_schema_extra=DATE
+    )
+    updated_at: str = Field(
+        description="When the comment was last updated", json_schema_extra=DATE
+    )
+    body: str = Field(description="The text of the comment", json_schema_extra=TEXT)
     pull_request_review_id: Optional[int] = Field(
         None, description="ID of the associated review"
     )
@@ -36,16 +54,20 @@ class ReviewThread(BaseModel):
         None, description="The ID of the pull request review that initiated this thread"
     )
     path: str = Field(
-        description="The relative path of the file to which the thread applies"
+        description="The relative path of the file to which the thread applies",
+        json_schema_extra=KEYWORD,
     )
     diff_hunk: str = Field(
-        description="The diff of the line that the review thread refers to"
+        description="The diff of the line that the review thread refers to",
+        json_schema_extra=NOT_INDEXED,
     )
     commit_id: str = Field(
-        description="The SHA of the commit to which the review thread applies"
+        description="The SHA of the commit to which the review thread applies",
+        json_schema_extra=KEYWORD,
     )
     original_commit_id: str = Field(
-        description="The SHA of the original commit to which the review thread applies"
+        description="The SHA of the original commit to which the review thread applies",
+        json_schema_extra=KEYWORD,
     )
     position: Optional[int] = Field(
         None,
@@ -71,7 +93,9 @@ class ReviewThread(BaseModel):
         description="The original first line of the range for a multi-line comment",
     )
     comments: List[ThreadComment] = Field(
-        default_factory=list, description="Comments in this thread"
+        default_factory=list,
+        description="Comments in this thread",
+        json_schema_extra=NESTED,
     )
 
 
@@ -79,10 +103,16 @@ class Comment(BaseModel):
     """Represents a general comment on the issue/PR"""
 
     id: int = Field(description="Unique identifier for the comment")
-    author: str = Field(description="Username of the comment author")
-    created_at: str = Field(description="When the comment was created")
-    updated_at: str = Field(description="When the comment was last updated")
-    body: str = Field(description="The text of the comment")
+    author: str = Field(
+        description="Username of the comment author", json_schema_extra=KEYWORD
+    )
+    created_at: str = Field(
+        description="When the comment was created", json_schema_extra=DATE
+    )
+    updated_at: str = Field(
+        description="When the comment was last updated", json_schema_extra=DATE
+    )
+    body: str = Field(description="The text of the comment", json_schema_extra=TEXT)
 
 
 class GitHubDocument(ScrapedDocument):
@@ -91,12 +121,18 @@ class GitHubDocument(ScrapedDocument):
     type: Literal["issue", "pull"] = Field(
         description="Document type: 'issue' or 'pull'"
     )
-    number: str = Field(description="Issue or PR number")
+    number: str = Field(description="Issue or PR number", json_schema_extra=KEYWORD)
     body: str = Field(description="Issue/PR description")
     created_at: str = Field(description="When the issue/PR was created")
-    updated_at: str = Field(description="When the issue/PR was last updated")
-    closed_at: Optional[str] = Field(description="When the issue/PR was closed")
-    merged_at: Optional[str] = Field(description="When the PR was merged")
+    updated_at: str = Field(
+        description="When the issue/PR was last updated", json_schema_extra=DATE
+    )
+    closed_at: Optional[str] = Field(
+        description="When the issue/PR was closed", json_schema_extra=DATE
+    )
+    merged_at: Optional[str] = Field(
+        description="When the PR was merged", json_schema_extra=DATE
+    )
     state: Literal["open", "merged", "closed", "draft"] = Field(
         description="Current state"
     )
@@ -104,19 +140,23 @@ class GitHubDocument(ScrapedDocument):
 
     # Optional PR-specific fields
     head_sha: Optional[str] = Field(
-        default=None, description="SHA of the PR head commit"
+        default=None, description="SHA of the PR head commit", json_schema_extra=KEYWORD
     )
     draft: Optional[bool] = Field(
         default=False, description="Whether the PR is a draft"
     )
     reviews: Optional[List[Review]] = Field(
-        default=None, description="Formal code reviews (PR only)"
+        default=None,
+        description="Formal code reviews (PR only)",
+        json_schema_extra=NESTED,
     )
     review_threads: Optional[List[ReviewThread]] = Field(
-        default=None, description="Code review discussion threads (PR only)"
+        default=None,
+        description="Code review discussion threads (PR only)",
+        json_schema_extra=NESTED,
     )
 
     # Common fields
     comments: List[Comment] = Field(
-        default_factory=list, description="General comments"
+        default_factory=list, description="General comments", json_schema_extra=NESTED
     )
@@ -22,6 +22,11 @@ class SourceConfig(BaseModel):
     type: Optional[str] = None
     test_resources: Optional[List[str]] = []
     processors: List[str] = []
+    processing_concurrency: int = 1  # Documents processed concurrently
+    processing_batch_size: Optional[
+        int
+    ] = None  # Micro-batch size for batch-capable processors (default: concurrency)
+    processing_batch_wait: float = 0.1  # Seconds a micro-batch waits to fill
     analyzer_config: Optional[AnalyzerConfig] = None
     checkout_commit: Optional[
         str
@@ -1,5 +1,17 @@
 from .abstract_output import AbstractOutput
 from .elasticsearch_output import ElasticsearchOutput
+from .async_elasticsearch_output import AsyncElasticsearchOutput
 from .mock_output import MockOutput
+from .parquet_output import ParquetOutput
+from .sqlite_output import SqliteOutput
+from .tee_output import TeeOutput
 
-__all__ = ["AbstractOutput", "ElasticsearchOutput", "MockOutput"]
+__all__ = [
+    "AbstractOutput",
+    "ElasticsearchOutput",
+    "AsyncElasticsearchOutput",
+    "MockOutput",
+    "ParquetOutput",
+    "SqliteOutput",
+    "TeeOutput",
+]
@@ -1,10 +1,17 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from loguru import logger
 
 from scraper.config import settings
-from scraper.models import ScraperRunDocument, ScrapedDocument
+from scraper.models import (
+    BulkLoadStats,
+    IndexingFailure,
+    ScraperRunDocument,
+    ScrapedDocument,
+)
+from scraper.outputs.dead_letter import DeadLetterSpool
 
 
 class AbstractOutput(ABC):
@@ -17,20 +24,128 @@ class AbstractOutput(ABC):
 
     Concrete implementations of this class handle the specifics of
     how data is stored or transmitted (e.g., to a database, file, or API).
+
+    A batch is flushed as soon as it holds `batch_size` documents, reaches
+    `max_batch_bytes` of serialized payload, or its oldest document has waited
+    `max_batch_latency` seconds, whichever comes first. Each document is
+    serialized once when buffered and the payload is reused for the write.
+
+    Full batches are handed to background flush workers through a bounded
+    queue, so producers only wait when `queue_size` batches are already
+    pending. Up to `max_in_flight` batches are written concurrently.
     """
 
-    def __init__(self, index_name: str = None, batch_size: int = 100):
+    def __init__(
+        self,
+        index_name: str = None,
+        batch_size: int = 100,
+        max_in_flight: int = 1,
+        queue_size: int = 2,
+        max_batch_bytes: int = 10 * 1024 * 1024,
+        max_batch_latency: Optional[float] = 5.0,
+        source: Optional[str] = None,
+    ):
         self.batch_size = batch_size
+        self.max_in_flight = max(1, max_in_flight)
+        self.queue_size = max(1, queue_size)
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_latency = max_batch_latency
         self.document_buffer: List[ScrapedDocument] = []
+        self.payload_buffer: List[bytes] = []
+        self.buffer_bytes = 0
+        self.failures: List[IndexingFailure] = []
+        self.documents_skipped = 0
+        # Set while the output is tuned for a backfill, see start_bulk_load
+        self.bulk_load: Optional[BulkLoadStats] = None
         self.index_name = index_name or settings.DEFAULT_INDEX
+        # Name of the source being scraped, when the output serves a single source
+        self.source = source
+        self.dead_letter = DeadLetterSpool(self.__class__.__name__, self.index_name)
+        self._flush_queue: Optional[asyncio.Queue] = None
+        self._flush_workers: List[asyncio.Task] = []
+        self._buffer_deadline: Optional[float] = None
+        self._buffer_filled = asyncio.Event()
 
     async def __aenter__(self):
         await self._initialize()
+        self._start_flush_workers()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.flush_buffer()
-        await self._cleanup()
+        try:
+            await self.drain()
+        finally:
+            await self._stop_flush_workers()
+            self.dead_letter.close()
+            await self._cleanup()
+
+    def _start_flush_workers(self):
+        """Start the background tasks that write queued batches."""
+        self._flush_queue = asyncio.Queue(maxsize=self.queue_size)
+        self._flush_workers = [
+            asyncio.create_task(self._flush_worker())
+            for _ in range(self.max_in_flight)
+        ]
+        if self.max_batch_latency:
+            self._flush_workers.append(asyncio.create_task(self._latency_flusher()))
+
+    async def _stop_flush_workers(self):
+        """Cancel the background flush tasks once the queue has been drained."""
+        for worker in self._flush_workers:
+            worker.cancel()
+        await asyncio.gather(*self._flush_workers, return_exceptions=True)
+        self._flush_workers = []
+        self._flush_queue = None
+
+    async def _flush_worker(self):
+        """
+        Write batches from the flush queue until cancelled.
+
+        An error in one batch (e.g. while spooling its failures) is logged and
+        the worker moves on, so queued batches are still written and drain()
+        does not wait on a dead worker.
+        """
+        while True:
+            batch, payloads = await self._flush_queue.get()
+            try:
+                await self._write_batch(batch, payloads)
+            except Exception as e:
+                logger.error(f"Error writing a batch of {len(batch)} documents: {e}")
+                logger.exception("Full traceback:")
+            finally:
+                self._flush_queue.task_done()
+
+    async def _latency_flusher(self):
+        """Flush the buffer once its oldest document has waited max_batch_latency."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._buffer_filled.wait()
+            delay = self._buffer_deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            await self.flush_buffer()
+
+    async def _write_batch(self, batch: List[ScrapedDocument], payloads: List[bytes]):
+        """Index a batch, record its failures and spool the failed documents."""
+        try:
+            failures = await self._index_batch(batch, payloads) or []
+        except Exception as e:
+            logger.error(f"Error during batch indexing: {e}")
+            logger.exception("Full traceback:")
+            failures = [
+                IndexingFailure(
+                    document_id=doc.id, error_type=type(e).__name__, reason=str(e)
+                )
+                for doc in batch
+            ]
+        self.failures.extend(failures)
+        self.dead_letter.spool(
+            failures, {doc.id: payload for doc, payload in zip(batch, payloads)}
+        )
+        logger.debug(
+            f"{self.__class__.__name__}: Indexed {len(batch) - len(failures)} documents to {self.index_name} ({len(failures)} failed)"
+        )
 
     @abstractmethod
     async def _initialize(self):
@@ -53,7 +168,9 @@ class AbstractOutput(ABC):
         pass
 
     @abstractmethod
-    async def _index_batch(self, documents: List[ScrapedDocument]):
+    async def _index_batch(
+        self, documents: List[ScrapedDocument], payloads: List[bytes]
+    ) -> Optional[List[IndexingFailure]]:
         """
         Index a batch of documents.
 
@@ -62,6 +179,12 @@ class AbstractOutput(ABC):
 
         Args:
             documents (List[ScrapedDocument]): A list of documents to be indexed.
+            payloads (List[bytes]): The serialized form of each document, as
+                returned by `serialize_document`, in the same order.
+
+        Returns:
+            Optional[List[IndexingFailure]]: The documents of the batch that could
+            not be indexed. Outputs that cannot fail per document may return None.
         """
         pass
 
@@ -69,28 +192,91 @@ class AbstractOutput(ABC):
         """
         Index a single document.
 
-        This method adds the document to the buffer and flushes the buffer if it reaches the batch size.
+        This method adds the document to the buffer and flushes the buffer if it reaches the batch size
+        or byte limit. It only waits for indexing when the flush queue is full.
 
         Args:
             document (ScrapedDocument): The document to be indexed.
         """
+        payload = self.serialize_document(document)
+
+        # Keep batches under the byte limit; an oversized document goes alone
+        if (
+            self.document_buffer
+            and self.buffer_bytes + len(payload) > self.max_batch_bytes
+        ):
+            await self.flush_buffer()
+
+        if not self.document_buffer:
+            self._buffer_deadline = asyncio.get_running_loop().time() + (
+                self.max_batch_latency or 0
+            )
+            self._buffer_filled.set()
         self.document_buffer.append(document)
-        if len(self.document_buffer) >= self.batch_size:
+        self.payload_buffer.append(payload)
+        self.buffer_bytes += len(payload)
+
+        if (
+            len(self.document_buffer) >= self.batch_size
+            or self.buffer_bytes >= self.max_batch_bytes
+        ):
             await self.flush_buffer()
 
+    def serialize_document(self, document: ScrapedDocument) -> bytes:
+        """
+        Serialize a document for writing.
+
+        Called once per document when it is buffered; the result is used both
+        to size the batch and as the payload passed to `_index_batch`. Also
+        sets the document's `content_hash`, computed from the same dump.
+        """
+        return document.dump_json_with_content_hash()
+
     async def flush_buffer(self):
         """
         Flush the current buffer of documents.
 
-        This method indexes the current batch of documents in the buffer and clears the buffer.
+        This method hands the current batch of documents to the flush workers and starts a new buffer.
         It's called automatically when the buffer reaches the batch size, but can also be called manually.
+        Outside of the output context the batch is indexed inline.
         """
-        if self.document_buffer:
-            await self._index_batch(self.document_buffer)
-            logger.debug(
-                f"{self.__class__.__name__}: Indexed {len(self.document_buffer)} documents to {self.index_name}"
-            )
-            self.document_buffer.clear()
+        if not self.document_buffer:
+            return
+        batch, self.document_buffer = self.document_buffer, []
+        payloads, self.payload_buffer = self.payload_buffer, []
+        self.buffer_bytes = 0
+        self._buffer_filled.clear()
+        if self._flush_queue is None:
+            await self._write_batch(batch, payloads)
+        else:
+            await self._flush_queue.put((batch, payloads))
+
+    async def drain(self):
+        """
+        Flush the buffer and wait until every queued batch has been written.
+        """
+        await self.flush_buffer()
+        if self._flush_queue is not None:
+            await self._flush_queue.join()
+
+    async def start_bulk_load(self):
+        """
+        Prepare the output for a large backfill.
+
+        Called by scrapers that are about to write a whole source from
+        scratch. Outputs that can trade freshness for write throughput (e.g.
+        by pausing index refreshes) do so here and set `bulk_load`.
+        """
+        pass
+
+    async def end_bulk_load(self):
+        """
+        Undo start_bulk_load once every batch has been written.
+
+        Called before the run is recorded; outputs must also call it from
+        `_cleanup` so a failed run never leaves the output tuned for loading.
+        """
+        pass
 
     @abstractmethod
     async def get_last_successful_run(
@@ -0,0 +1,138 @@
+from elasticsearch import AsyncElasticsearch, TransportError
+from elasticsearch.helpers import async_streaming_bulk
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+from scraper.models import IndexingFailure, ScraperRunDocument
+from scraper.config import settings
+from scraper.outputs.elasticsearch_mapping import generate_mapping
+from scraper.outputs.elasticsearch_output import (
+    ElasticsearchOutput,
+    bulk_item_failure,
+    stored_hashes,
+)
+from scraper.registry import output_registry
+
+
+@output_registry.register("elasticsearch-async")
+class AsyncElasticsearchOutput(ElasticsearchOutput):
+    """
+    Handles document indexing and retrieval using the asynchronous Elasticsearch client.
+
+    Behaves like ElasticsearchOutput (same batching, retries and run documents),
+    but every request is awaited on the event loop instead of blocking it, so
+    scrapers keep fetching while batches are being written.
+    """
+
+    async def _initialize(self):
+        """Set up the async Elasticsearch client."""
+        try:
+            self.es = AsyncElasticsearch(
+                cloud_id=settings.CLOUD_ID, api_key=settings.API_KEY, timeout=120
+            )
+        except Exception as e:
+            logger.error(f"Failed to initialize Elasticsearch: {e}")
+            raise
+
+    async def _cleanup(self):
+        """Clean up Elasticsearch client resources."""
+        if self.es:
+            await self._restore_after_bulk_load()
+            await self.es.close()
+
+    async def _bulk_index(
+        self, payloads: Dict[str, bytes], retries: int
+    ) -> List[IndexingFailure]:
+        """
+        Send one bulk request for the given payloads and return the failed items.
+        """
+        failures: List[IndexingFailure] = []
+        try:
+            async for ok, item in async_streaming_bulk(
+                self.es,
+                self._bulk_actions(payloads),
+                chunk_size=len(payloads),
+                max_chunk_bytes=self._max_chunk_bytes(payloads),
+                raise_on_error=False,
+                raise_on_exception=False,
+            ):
+                if not ok:
+                    failures.append(bulk_item_failure(item, retries))
+            return failures
+        except TransportError as e:
+            logger.warning(f"Bulk request failed: {e}")
+            return [
+                IndexingFailure(
+                    document_id=doc_id,
+                    error_type=type(e).__name__,
+                    reason=str(e),
+                    retries=retries,
+                )
+                for doc_id in payloads
+            ]
+
+    async def _stored_hashes(self, ids: List[str]) -> Dict[str, str]:
+        """Fetch the stored content hash of each existing document id."""
+        result = await self.es.mget(
+            index=self.index_name, ids=ids, source_includes=["content_hash"]
+        )
+        return stored_hashes(result)
+
+    async def _index_settings(self) -> Dict[str, Any]:
+        """Return the flat settings of the index (or of the index behind the alias)."""
+        result = await self.es.indices.get_settings(
+            index=self.index_name, flat_settings=True
+        )
+        return next(iter(result.values()))["settings"]
+
+    async def _put_index_settings(self, index_settings: Dict[str, Any]):
+        await self.es.indices.put_settings(
+            index=self.index_name, settings=index_settings
+        )
+
+    async def _force_merge(self) -> Optional[str]:
+        """Start a force merge in the background and return its task id."""
+        await self.es.indices.refresh(index=self.index_name)
+        result = await self.es.indices.forcemerge(
+            index=self.index_name, wait_for_completion=False
+        )
+        return result.get("task")
+
+    async def record_run(self, run_document: ScraperRunDocument) -> None:
+        """Record statistics for a scraper run in the runs index and the local cache"""
+        self.run_cache.record(run_document)
+        await self._ensure_runs_index()
+        await self.es.index(
+            index=self.runs_index,
+            document=run_document.model_dump(exclude_none=True),
+        )
+
+    async def _ensure_runs_index(self):
+        """Create the runs index with its mapping the first time a run is recorded."""
+        if self._runs_index_ready:
+            return
+        if not await self.es.indices.exists(index=self.runs_index):
+            await self.create_index_with_mapping(
+                self.runs_index, generate_mapping(ScraperRunDocument)
+            )
+        self._runs_index_ready = True
+
+    async def _search_runs(self, index: str, query: dict) -> List[ScraperRunDocument]:
+        result = await self.es.search(index=index, body=query, ignore_unavailable=True)
+        return [ScraperRunDocument(**hit["_source"]) for hit in result["hits"]["hits"]]
+
+    async def create_index_with_mapping(self, index_name: str, mapping: dict):
+        """
+        Create an index with a specific mapping.
+        If the index exists, raise an error.
+        """
+        try:
+            if await self.es.indices.exists(index=index_name):
+                raise ValueError(f"Index {index_name} already exists")
+
+            await self.es.indices.create(index=index_name, body=mapping)
+            logger.info(f"Created index {index_name} with custom mapping")
+
+        except Exception as e:
+            logger.error(f"Error creating index {index_name}: {e}")
+            raise
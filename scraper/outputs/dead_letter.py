@@ -0,0 +1,89 @@
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from loguru import logger
+from pydantic import ConfigDict
+
+from scraper.config import settings
+from scraper.models import IndexingFailure, ScrapedDocument
+from scraper.outputs.jsonl import JsonlWriter, read_jsonl
+
+
+def default_spool_dir() -> Path:
+    """Directory where outputs spool the documents they failed to write."""
+    return Path(
+        settings.config.get(
+            "dead_letter_dir", os.path.join(settings.DATA_DIR, "dead_letter")
+        )
+    )
+
+
+class SpooledDocument(ScrapedDocument):
+    """
+    A document read back from the spool.
+
+    Extra fields are kept so subclass data (e.g. GitHub reviews) survives the
+    round trip and is written back unchanged.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+
+class DeadLetterSpool:
+    """
+    Appends failed documents to gzip-compressed NDJSON, one record per document:
+
+        {"index": ..., "output": ..., "error": {...}, "document": {...}}
+
+    The file is only created once the first failure is spooled.
+    """
+
+    def __init__(self, output_name: str, index_name: str, spool_dir: Path = None):
+        self.output_name = output_name
+        self.index_name = index_name
+        spool_dir = spool_dir or default_spool_dir()
+        self.base_path = (
+            spool_dir
+            / f"{index_name}.{output_name.lower()}.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+        self.count = 0
+        self._writer: Optional[JsonlWriter] = None
+
+    def spool(self, failures: List[IndexingFailure], payloads: Dict[str, bytes]):
+        """Append each failed document, with its error, to the spool."""
+        if not failures:
+            return
+        if self._writer is None:
+            self._writer = JsonlWriter(self.base_path, compression="gzip")
+        header = {"index": self.index_name, "output": self.output_name}
+        lines = [
+            # The payload already is the document's JSON, embed it as-is
+            json.dumps(
+                {**header, "error": failure.model_dump(exclude_none=True)}
+            ).encode("utf-8")[:-1]
+            + b', "document": '
+            + payloads[failure.document_id]
+            + b"}"
+            for failure in failures
+            if failure.document_id in payloads
+        ]
+        self._writer.write_lines(lines)
+        self._writer.flush()
+        self.count += len(lines)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            logger.warning(
+                f"Spooled {self.count} failed documents to {self._writer.paths[0]}. "
+                f"Replay them with: scraper elastic replay {self._writer.paths[0]}"
+            )
+            self._writer = None
+
+
+def read_spool(path: Union[str, Path] = None) -> Iterator[Dict[str, Any]]:
+    """Yield spooled records from a spool file or directory (default spool dir)."""
+    return read_jsonl(path or default_spool_dir())
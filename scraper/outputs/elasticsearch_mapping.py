@@ -0,0 +1,157 @@
+import types
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from scraper.models import (
+    BitcoinTranscriptDocument,
+    ScrapedDocument,
+    ScraperRunDocument,
+)
+from scraper.models.documents import PRReviewClubDocument, StackExchangeDocument
+from scraper.models.github_metadata import GitHubDocument
+
+# Document models written to the shared documents index
+DOCUMENT_MODELS: List[Type[BaseModel]] = [
+    ScrapedDocument,
+    BitcoinTranscriptDocument,
+    PRReviewClubDocument,
+    StackExchangeDocument,
+    GitHubDocument,
+]
+
+# Mapping of a string field without a hint: full text plus exact matching
+STRING_MAPPING = {
+    "type": "text",
+    "fields": {"keyword": {"type": "keyword", "ignore_above": 256}},
+}
+
+SCALAR_MAPPINGS = {
+    bool: {"type": "boolean"},
+    int: {"type": "long"},
+    float: {"type": "float"},
+}
+
+# Fields written to the index outside of the document models
+EXTRA_PROPERTIES = {"test_document": {"type": "boolean"}}
+
+INDEX_SETTINGS = {"codec": "best_compression"}
+
+
+def field_hint(model: Type[BaseModel], name: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the `es_mapping` hint of a field.
+
+    Subclasses that redefine a field (e.g. to change its description) keep the
+    hint of the field they override.
+    """
+    for klass in model.__mro__:
+        if not (isinstance(klass, type) and issubclass(klass, BaseModel)):
+            continue
+        field = klass.model_fields.get(name)
+        if field is not None and isinstance(field.json_schema_extra, dict):
+            hint = field.json_schema_extra.get("es_mapping")
+            if hint:
+                return hint
+    return None
+
+
+def field_mapping(
+    annotation, hint: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Map a pydantic field annotation (and its hint) to an Elasticsearch field."""
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return field_mapping(args[0], hint)
+        return dict(hint or STRING_MAPPING)
+    if origin in (list, List):
+        (item,) = get_args(annotation)
+        return field_mapping(item, hint)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        mapping = dict(hint or {})
+        if mapping.get("type", "object") in ("object", "nested"):
+            mapping["properties"] = model_properties(annotation)
+        return mapping
+    if hint:
+        return dict(hint)
+    if origin is Literal:
+        return {"type": "keyword"}
+    return dict(SCALAR_MAPPINGS.get(annotation, STRING_MAPPING))
+
+
+def model_properties(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Build the mapping properties of a model's fields."""
+    return {
+        name: field_mapping(field.annotation, field_hint(model, name))
+        for name, field in model.model_fields.items()
+    }
+
+
+def merge_properties(
+    target: Dict[str, Any], properties: Dict[str, Any], path: str = ""
+) -> Dict[str, Any]:
+    """
+    Merge mapping properties into `target`.
+
+    Object fields are merged recursively; a field mapped differently by two
+    models raises a ValueError, as a single index cannot hold both.
+    """
+    for name, mapping in properties.items():
+        existing = target.get(name)
+        if existing is None:
+            target[name] = mapping
+        elif "properties" in existing and "properties" in mapping and {
+            k: v for k, v in existing.items() if k != "properties"
+        } == {k: v for k, v in mapping.items() if k != "properties"}:
+            merge_properties(
+                existing["properties"], mapping["properties"], f"{path}{name}."
+            )
+        elif existing != mapping:
+            raise ValueError(
+                f"Conflicting mappings for {path}{name}: {existing} != {mapping}"
+            )
+    return target
+
+
+def generate_mapping(
+    *models: Type[BaseModel], extra_properties: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """
+    Generate the index settings and mappings for documents of the given models.
+
+    Field types come from the annotations, refined by the `es_mapping` hints
+    declared on the fields (see scraper.models.documents):
+
+        from scraper.outputs.elasticsearch_mapping import generate_mapping
+        mapping = generate_mapping(*DOCUMENT_MODELS)
+    """
+    properties: Dict[str, Any] = {}
+    for model in models:
+        merge_properties(properties, model_properties(model))
+    merge_properties(properties, extra_properties or {})
+    return {"settings": dict(INDEX_SETTINGS), "mappings": {"properties": properties}}
+
+
+def generated_mappings() -> Dict[str, Dict[str, Any]]:
+    """The mapping files kept in scraper/mappings, by file name."""
+    return {
+        "documents.json": generate_mapping(
+            *DOCUMENT_MODELS, extra_properties=EXTRA_PROPERTIES
+        ),
+        "github_metadata.json": generate_mapping(
+            GitHubDocument, extra_properties=EXTRA_PROPERTIES
+        ),
+        "runs.json": generate_mapping(ScraperRunDocument),
+    }
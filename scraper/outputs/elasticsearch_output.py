@@ -1,24 +1,83 @@
-from elasticsearch import Elasticsearch
-from typing import Any, List, Optional
+import asyncio
+from elasticsearch import Elasticsearch, NotFoundError, TransportError
+from elasticsearch.helpers import streaming_bulk
+from typing import Any, Dict, List, Optional
 import logging
 from loguru import logger
 
-from scraper.models import ScrapedDocument, ScraperRunDocument
+from scraper.models import (
+    BulkLoadStats,
+    IndexingFailure,
+    ScrapedDocument,
+    ScraperRunDocument,
+)
 from scraper.config import settings
 from scraper.outputs import AbstractOutput
+from scraper.outputs.elasticsearch_mapping import generate_mapping
+from scraper.outputs.run_cache import RunCache
 from scraper.registry import output_registry
 
 
+# Bulk item statuses that indicate a transient condition worth retrying
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+
+def bulk_item_failure(item: Dict[str, Any], retries: int) -> IndexingFailure:
+    """
+    Convert a failed item yielded by the bulk helpers into an IndexingFailure.
+
+    Items rejected by Elasticsearch carry a structured error, while items of a
+    chunk whose whole request failed carry the error message and exception.
+    """
+    op_result = next(iter(item.values()))
+    error = op_result.get("error")
+    if isinstance(error, dict):
+        error_type = error.get("type", "unknown")
+        reason = error.get("reason")
+    else:
+        exception = op_result.get("exception")
+        error_type = type(exception).__name__ if exception else "unknown"
+        reason = str(error) if error else None
+    return IndexingFailure(
+        document_id=op_result.get("_id"),
+        error_type=error_type,
+        reason=reason,
+        status=op_result.get("status"),
+        retries=retries,
+    )
+
+
+def stored_hashes(mget_result: Dict[str, Any]) -> Dict[str, str]:
+    """Map document ids to the content hashes found in an mget response."""
+    return {
+        doc["_id"]: doc["_source"]["content_hash"]
+        for doc in mget_result["docs"]
+        if doc.get("found") and "content_hash" in doc.get("_source", {})
+    }
+
+
 @output_registry.register("elasticsearch")
 class ElasticsearchOutput(AbstractOutput):
     """
     Handles document indexing and retrieval using synchronous Elasticsearch client.
     Leverages AbstractOutput's batching mechanism for efficient indexing.
+    Indexing requests run in worker threads, so batches are written while
+    the scraper keeps parsing.
     """
 
+    INITIAL_BACKOFF = 2
+    MAX_BACKOFF = 60
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.es = None
+        self.max_retries = settings.config.getint("bulk_max_retries", 3)
+        self.skip_unchanged = settings.config.getboolean("skip_unchanged", True)
+        self.bulk_load_mode = settings.config.getboolean("bulk_load_mode", False)
+        # Run documents live in their own small index, mirrored to a local cache
+        self.runs_index = settings.config.get("runs_index", f"{self.index_name}_runs")
+        self.run_cache = RunCache.for_index(self.runs_index)
+        self._runs_index_ready = False
 
         # Configure logging levels for noisy libraries
         logging.getLogger("urllib3.connectionpool").setLevel(logging.WARNING)
@@ -37,39 +96,298 @@ class ElasticsearchOutput(AbstractOutput):
     async def _cleanup(self):
         """Clean up Elasticsearch client resources."""
         if self.es:
+            await self._restore_after_bulk_load()
             self.es.close()
 
-    async def _index_batch(self, documents: List[ScrapedDocument]):
+    async def _index_batch(
+        self, documents: List[ScrapedDocument], payloads: List[bytes]
+    ) -> List[IndexingFailure]:
+        """
+        Index a batch of documents with a single bulk request.
+
+        The payloads serialized when the documents were buffered are sent as-is.
+        Items that fail with a transient status (or whose request could not be
+        sent at all) are retried with exponential backoff, and only those items
+        are sent again. Items that still fail are returned as failures.
+        """
+        pending = {doc.id: payload for doc, payload in zip(documents, payloads)}
+        if self.skip_unchanged:
+            pending = await self._drop_unchanged(documents, pending)
+            if not pending:
+                return []
+        # `pending` shrinks to the retried documents, keep the batch size
+        batch_size = len(pending)
+        failures: List[IndexingFailure] = []
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                delay = min(self.INITIAL_BACKOFF * 2 ** (attempt - 1), self.MAX_BACKOFF)
+                logger.warning(
+                    f"Retrying {len(pending)} documents in {delay}s (attempt {attempt}/{self.max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+            retryable: Dict[str, IndexingFailure] = {}
+            for failure in await self._bulk_index(pending, retries=attempt):
+                if failure.status is None or failure.status in RETRYABLE_STATUSES:
+                    retryable[failure.document_id] = failure
+                else:
+                    failures.append(failure)
+
+            if not retryable:
+                break
+            pending = {doc_id: pending[doc_id] for doc_id in retryable}
+        else:
+            failures.extend(retryable.values())
+
+        for failure in failures:
+            logger.error(
+                f"Failed to index document {failure.document_id} after {failure.retries} retries: "
+                f"{failure.error_type}: {failure.reason}"
+            )
+        logger.info(
+            f"Indexed batch of {batch_size - len(failures)} documents ({len(failures)} failed)"
+        )
+        return failures
+
+    async def _drop_unchanged(
+        self, documents: List[ScrapedDocument], payloads: Dict[str, bytes]
+    ) -> Dict[str, bytes]:
+        """
+        Remove documents whose stored content hash matches the new one.
+
+        The stored hashes of the whole batch are fetched with a single mget.
+        If the lookup fails, every document is written.
+        """
+        try:
+            stored = await self._stored_hashes(list(payloads))
+        except Exception as e:
+            logger.warning(f"Could not fetch stored content hashes: {e}")
+            return payloads
+
+        unchanged = {
+            doc.id
+            for doc in documents
+            if doc.content_hash and stored.get(doc.id) == doc.content_hash
+        }
+        if unchanged:
+            self.documents_skipped += len(unchanged)
+            logger.debug(f"Skipping {len(unchanged)} unchanged documents")
+        return {
+            doc_id: payload
+            for doc_id, payload in payloads.items()
+            if doc_id not in unchanged
+        }
+
+    async def _stored_hashes(self, ids: List[str]) -> Dict[str, str]:
+        """Fetch the stored content hash of each existing document id."""
+        result = await asyncio.to_thread(
+            self.es.mget,
+            index=self.index_name,
+            ids=ids,
+            source_includes=["content_hash"],
+        )
+        return stored_hashes(result)
+
+    def _bulk_actions(self, payloads: Dict[str, bytes]):
+        """Yield bulk index actions for pre-serialized documents keyed by id."""
+        for doc_id, payload in payloads.items():
+            yield {"_index": self.index_name, "_id": doc_id, "_source": payload}
+
+    async def _bulk_index(
+        self, payloads: Dict[str, bytes], retries: int
+    ) -> List[IndexingFailure]:
+        """
+        Send one bulk request for the given payloads and return the failed items.
+
+        The blocking client runs in a thread, so the event loop keeps scraping
+        and other flush workers keep writing while the request is in flight.
+        """
+        return await asyncio.to_thread(self._send_bulk, payloads, retries)
+
+    def _send_bulk(
+        self, payloads: Dict[str, bytes], retries: int
+    ) -> List[IndexingFailure]:
+        try:
+            return [
+                bulk_item_failure(item, retries)
+                for ok, item in streaming_bulk(
+                    self.es,
+                    self._bulk_actions(payloads),
+                    chunk_size=len(payloads),
+                    max_chunk_bytes=self._max_chunk_bytes(payloads),
+                    raise_on_error=False,
+                    raise_on_exception=False,
+                )
+                if not ok
+            ]
+        except TransportError as e:
+            logger.warning(f"Bulk request failed: {e}")
+            return [
+                IndexingFailure(
+                    document_id=doc_id,
+                    error_type=type(e).__name__,
+                    reason=str(e),
+                    retries=retries,
+                )
+                for doc_id in payloads
+            ]
+
+    @staticmethod
+    def _max_chunk_bytes(payloads: Dict[str, bytes]) -> int:
+        """
+        Chunk byte limit that keeps a batch in one request.
+
+        Batches are already sized by AbstractOutput, so the helper's own limit
+        is raised above the batch size (plus action lines) to avoid splitting.
+        """
+        return sum(len(payload) + 256 for payload in payloads.values())
+
+    async def start_bulk_load(self):
         """
-        Index a batch of documents directly using Elasticsearch.
-        Uses AbstractOutput's batching mechanism.
+        Pause refreshes and drop replicas of the index for a backfill.
+
+        The index's own refresh_interval and number_of_replicas are kept in
+        `bulk_load` and restored by end_bulk_load (or, if the run fails before
+        that, when the output is cleaned up). The settings apply to the whole
+        index, so this is opt-in with `bulk_load_mode = True` in config.ini and
+        meant for dedicated indexes. An index whose refreshes are already paused
+        (e.g. by another backfill) is left alone.
         """
+        if not self.bulk_load_mode or self.bulk_load:
+            return
         try:
-            # Process documents one by one in the batch
-            for doc in documents:
-                try:
-                    self.es.index(
-                        index=self.index_name,
-                        id=doc.id,
-                        document=doc.model_dump(exclude_none=True),
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to index document {doc.id}: {e}")
-                    continue
-
-            logger.info(f"Successfully indexed batch of {len(documents)} documents")
+            current = await self._index_settings()
+        except NotFoundError:
+            logger.info(f"Index {self.index_name} does not exist yet, not bulk loading")
+            return
+        if str(current.get("index.refresh_interval")) == "-1":
+            logger.info(
+                f"Refreshes of {self.index_name} are already paused, not bulk loading"
+            )
+            return
+        self.bulk_load = BulkLoadStats(
+            refresh_interval=current.get("index.refresh_interval"),
+            number_of_replicas=current.get("index.number_of_replicas"),
+        )
+        await self._put_index_settings(
+            {"index.refresh_interval": "-1", "index.number_of_replicas": 0}
+        )
+        logger.info(
+            f"Bulk loading {self.index_name}: refreshes paused and replicas dropped"
+        )
 
+    async def end_bulk_load(self):
+        """Restore the index settings and start a force merge of the new segments."""
+        if not self.bulk_load or self.bulk_load.restored:
+            return
+        await self._put_index_settings(
+            {
+                "index.refresh_interval": self.bulk_load.refresh_interval,
+                "index.number_of_replicas": self.bulk_load.number_of_replicas,
+            }
+        )
+        self.bulk_load.restored = True
+        self.bulk_load.force_merge_task = await self._force_merge()
+        logger.info(
+            f"Restored settings of {self.index_name}, force merge task: "
+            f"{self.bulk_load.force_merge_task}"
+        )
+
+    async def _restore_after_bulk_load(self):
+        """Make sure a failed run does not leave the index without refreshes."""
+        try:
+            await self.end_bulk_load()
         except Exception as e:
-            logger.error(f"Error during batch indexing: {e}")
-            logger.exception("Full traceback:")
+            logger.error(
+                f"Failed to restore settings of {self.index_name} after bulk load "
+                f"({self.bulk_load.model_dump()}): {e}"
+            )
+
+    async def _index_settings(self) -> Dict[str, Any]:
+        """Return the flat settings of the index (or of the index behind the alias)."""
+        result = self.es.indices.get_settings(
+            index=self.index_name, flat_settings=True
+        )
+        return next(iter(result.values()))["settings"]
+
+    async def _put_index_settings(self, index_settings: Dict[str, Any]):
+        self.es.indices.put_settings(index=self.index_name, settings=index_settings)
+
+    async def _force_merge(self) -> Optional[str]:
+        """Start a force merge in the background and return its task id."""
+        await asyncio.to_thread(self.es.indices.refresh, index=self.index_name)
+        response = await asyncio.to_thread(
+            self.es.indices.forcemerge,
+            index=self.index_name,
+            wait_for_completion=False,
+        )
+        return response.get("task")
 
     async def record_run(self, run_document: ScraperRunDocument) -> None:
-        """Record statistics for a scraper run"""
+        """Record statistics for a scraper run in the runs index and the local cache"""
+        self.run_cache.record(run_document)
+        await self._ensure_runs_index()
         self.es.index(
-            index=self.index_name,
+            index=self.runs_index,
             document=run_document.model_dump(exclude_none=True),
         )
 
+    async def _ensure_runs_index(self):
+        """Create the runs index with its mapping the first time a run is recorded."""
+        if self._runs_index_ready:
+            return
+        if not self.es.indices.exists(index=self.runs_index):
+            await self.create_index_with_mapping(
+                self.runs_index, generate_mapping(ScraperRunDocument)
+            )
+        self._runs_index_ready = True
+
+    async def _search_runs(self, index: str, query: dict) -> List[ScraperRunDocument]:
+        result = self.es.search(index=index, body=query, ignore_unavailable=True)
+        return [ScraperRunDocument(**hit["_source"]) for hit in result["hits"]["hits"]]
+
+    def _runs_query(
+        self,
+        source: str,
+        must_terms: dict[str, Any] = None,
+        size: int = 1,
+    ) -> dict:
+        """
+        Build the search body used to query run documents.
+
+        `source` is matched on the whole name, ignoring case as the local run
+        cache and the SQLite output do. It is a keyword in the runs index, and
+        runs recorded in the documents index by earlier versions are matched
+        on its dynamic `source.keyword` subfield. `finished_at` is not mapped
+        in the documents index, so sorting on it must not fail there.
+        """
+        source_term = {"value": source, "case_insensitive": True}
+        must_clauses = [
+            {
+                "bool": {
+                    "should": [
+                        {"term": {"source": source_term}},
+                        {"term": {"source.keyword": source_term}},
+                    ],
+                    "minimum_should_match": 1,
+                }
+            },
+            {"term": {"type": "scraper_run"}},
+        ]
+
+        # Add additional term queries if provided
+        if must_terms:
+            must_clauses.extend({"term": {k: v}} for k, v in must_terms.items())
+
+        return {
+            "query": {"bool": {"must": must_clauses}},
+            "sort": [
+                {"finished_at": {"order": "desc", "unmapped_type": "date"}}
+            ],
+            "size": size,
+        }
+
     async def _query_runs(
         self,
         source: str,
@@ -87,31 +405,19 @@ class ElasticsearchOutput(AbstractOutput):
         Returns:
             List[ScraperRunDocument]: List of matching run documents
         """
+        query = self._runs_query(source, must_terms, size)
         try:
-            # Build base query
-            must_clauses = [
-                {"term": {"source": source.lower()}},
-                {"term": {"type": "scraper_run"}},
-            ]
-
-            # Add additional term queries if provided
-            if must_terms:
-                must_clauses.extend({"term": {k: v}} for k, v in must_terms.items())
-
-            query = {
-                "query": {"bool": {"must": must_clauses}},
-                "sort": [{"finished_at": {"order": "desc"}}],
-                "size": size,
-            }
-
-            result = self.es.search(index=self.index_name, body=query)
-            return [
-                ScraperRunDocument(**hit["_source"]) for hit in result["hits"]["hits"]
-            ]
+            runs = await self._search_runs(self.runs_index, query)
+            if not runs:
+                # Runs recorded before the runs index existed
+                runs = await self._search_runs(self.index_name, query)
+            return runs
 
         except Exception as e:
-            logger.error(f"Error querying runs for {source}: {e}")
-            return []
+            logger.warning(
+                f"Error querying runs for {source}, using the local run cache: {e}"
+            )
+            return self.run_cache.runs(source, must_terms, size)
 
     async def get_last_successful_run(
         self, source: str
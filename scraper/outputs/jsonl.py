@@ -0,0 +1,176 @@
+import gzip
+import io
+import json
+import re
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from loguru import logger
+
+# File suffix added for each supported compression
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compression requires the 'zstandard' package: "
+            "poetry install --extras zstd"
+        )
+    return zstandard
+
+
+def open_compressed(path: Union[str, Path], mode: str) -> IO[bytes]:
+    """
+    Open a binary file, transparently (de)compressing based on its suffix.
+
+    Args:
+        path: Path of the file; `.gz` and `.zst` files are compressed.
+        mode: "rb", "wb" or "ab".
+    """
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)
+    if path.suffix == ".zst":
+        zstandard = _zstandard()
+        raw = open(path, mode)
+        if "r" in mode:
+            return zstandard.ZstdDecompressor().stream_reader(
+                raw, closefd=True, read_across_frames=True
+            )
+        return zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+    return open(path, mode)
+
+
+class JsonlWriter:
+    """
+    Append-only writer for newline-delimited JSON files.
+
+    Lines are written through a single open file handle. When `max_file_bytes`
+    is set, the output is rotated into numbered parts
+    (`name.0000.jsonl`, `name.0001.jsonl`, ...) once a part reaches that many
+    uncompressed bytes. Parts already on disk are kept: a new writer for the
+    same base path starts after the highest existing part.
+    """
+
+    def __init__(
+        self,
+        base_path: Union[str, Path],
+        compression: Optional[str] = None,
+        max_file_bytes: Optional[int] = None,
+    ):
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(
+                f"Unsupported compression: {compression}. "
+                f"Use one of: {[c for c in COMPRESSION_SUFFIXES if c]}"
+            )
+        if compression == "zstd":
+            _zstandard()
+        self.base_path = Path(base_path)
+        self.compression = compression
+        self.max_file_bytes = max_file_bytes
+        self.paths: List[Path] = []
+        self._file: Optional[IO[bytes]] = None
+        self._file_bytes = 0
+        self._next_part: Optional[int] = None
+
+    @property
+    def _suffix(self) -> str:
+        return ".jsonl" + COMPRESSION_SUFFIXES[self.compression]
+
+    def _existing_parts(self) -> int:
+        """Number following the highest part already written for the base path."""
+        pattern = re.compile(
+            rf"{re.escape(self.base_path.name)}\.(\d+){re.escape(self._suffix)}"
+        )
+        numbers = [
+            int(match.group(1))
+            for path in self.base_path.parent.glob(f"{self.base_path.name}.*")
+            if (match := pattern.fullmatch(path.name))
+        ]
+        return max(numbers) + 1 if numbers else 0
+
+    def _next_path(self) -> Path:
+        if self.max_file_bytes:
+            if self._next_part is None:
+                self._next_part = self._existing_parts()
+            part, self._next_part = self._next_part, self._next_part + 1
+            return self.base_path.with_name(
+                f"{self.base_path.name}.{part:04d}{self._suffix}"
+            )
+        return self.base_path.with_name(f"{self.base_path.name}{self._suffix}")
+
+    def _open_next(self):
+        self.close()
+        path = self._next_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open_compressed(path, "ab")
+        self._file_bytes = 0
+        self.paths.append(path)
+
+    def write_lines(self, lines: Iterable[bytes]):
+        """Append already serialized JSON lines (without trailing newline)."""
+        for line in lines:
+            if self._file is None or (
+                self.max_file_bytes and self._file_bytes >= self.max_file_bytes
+            ):
+                self._open_next()
+            self._file.write(line)
+            self._file.write(b"\n")
+            self._file_bytes += len(line) + 1
+
+    def write(self, records: Iterable[Dict[str, Any]]):
+        """Serialize and append records."""
+        self.write_lines(
+            json.dumps(record, default=str).encode("utf-8") for record in records
+        )
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def jsonl_paths(path: Union[str, Path]) -> List[Path]:
+    """
+    Resolve a JSONL path to the files it refers to.
+
+    Accepts a single file, a directory (all JSONL files in it), or the base
+    path given to a JsonlWriter (all of its parts, in order).
+    """
+    path = Path(path)
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if ".jsonl" in p.suffixes)
+    return sorted(path.parent.glob(f"{path.name}*.jsonl*"))
+
+
+def read_jsonl(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records stored in JSONL output, decompressing as needed.
+
+    Example:
+        for document in read_jsonl("mock_output_20240101_120000"):
+            print(document["id"])
+    """
+    paths = jsonl_paths(path)
+    if not paths:
+        logger.warning(f"No JSONL files found for {path}")
+    for file_path in paths:
+        with open_compressed(file_path, "rb") as raw:
+            for line in io.TextIOWrapper(raw, encoding="utf-8"):
+                if line.strip():
+                    yield json.loads(line)
@@ -7,26 +7,56 @@ from loguru import logger
 
 from scraper.models import ScrapedDocument, ScraperRunDocument
 from scraper.outputs import AbstractOutput
+from scraper.outputs.jsonl import JsonlWriter
+from scraper.outputs.run_cache import RunCache
 from scraper.config import settings
 from scraper.registry import output_registry
 
 
 @output_registry.register("mock")
 class MockOutput(AbstractOutput):
+    """
+    Writes documents to a local file instead of a real backend.
+
+    The default `json` format keeps a single JSON file with `documents` and
+    `runs` arrays, rewritten on every flush. The `jsonl` format (set
+    `mock_output_format = jsonl`) appends one document per line through a
+    single open file handle, with optional compression
+    (`mock_output_compression = gzip|zstd`) and size-based rotation
+    (`mock_output_max_file_mb`). Use `scraper.outputs.jsonl.read_jsonl` to
+    read it back.
+
+    Runs are also kept in the local run cache. By default every mock run
+    starts from scratch; set `mock_output_resume = True` to resume from the
+    last cached run instead, as an offline stand-in for incremental runs.
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.output_file = (
-            f"mock_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        )
+        self.output_name = f"mock_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.output_file = f"{self.output_name}.json"
         self.excluded_fields = [
             field.strip()
             for field in settings.config.get("mock_output_excluded_fields", "").split(
                 ","
             )
         ]
+        self.format = settings.config.get("mock_output_format", "json")
+        self.writer: Optional[JsonlWriter] = None
+        self.run_cache = RunCache.for_index(f"{self.index_name}_mock_runs")
+        self.resume = settings.config.getboolean("mock_output_resume", False)
 
     async def _initialize(self):
         """Initialize the output file with empty documents and runs arrays"""
+        if self.format == "jsonl":
+            max_file_mb = settings.config.getint("mock_output_max_file_mb", 0)
+            self.writer = JsonlWriter(
+                self.output_name,
+                compression=settings.config.get("mock_output_compression") or None,
+                max_file_bytes=max_file_mb * 1024 * 1024 or None,
+            )
+            return
+
         self._write_json(
             {
                 "documents": [],
@@ -35,10 +65,24 @@ class MockOutput(AbstractOutput):
         )
 
     async def _cleanup(self):
+        if self.writer:
+            self.writer.close()
+            written_to = ", ".join(str(path) for path in self.writer.paths)
+        else:
+            written_to = self.output_file
         logger.info(
-            f"Mock output written to {self.output_file} (excluded fields: {self.excluded_fields})"
+            f"Mock output written to {written_to} (excluded fields: {self.excluded_fields})"
         )
 
+    def serialize_document(self, document: ScrapedDocument) -> bytes:
+        """Serialize a document without the excluded fields"""
+        if not any(self.excluded_fields):
+            return super().serialize_document(document)
+        document.content_hash = document.compute_content_hash()
+        return document.model_dump_json(
+            exclude_none=True, exclude=set(self.excluded_fields)
+        ).encode("utf-8")
+
     def _write_json(self, data: Dict):
         """Write data to the output file"""
         with open(self.output_file, "w") as f:
@@ -57,8 +101,16 @@ class MockOutput(AbstractOutput):
         data["documents"].extend(documents)
         self._write_json(data)
 
-    async def _index_batch(self, documents: List[ScrapedDocument]):
+    async def _index_batch(
+        self, documents: List[ScrapedDocument], payloads: List[bytes]
+    ):
         """Index a batch of documents"""
+        if self.writer:
+            # The payloads already are the JSON lines to append
+            self.writer.write_lines(payloads)
+            self.writer.flush()
+            return
+
         docs_to_index = [
             doc.model_dump(exclude_none=True, exclude=self.excluded_fields)
             for doc in documents
@@ -69,15 +121,24 @@ class MockOutput(AbstractOutput):
     async def get_last_successful_run(
         self, source: str
     ) -> Optional[ScraperRunDocument]:
-        """Always return None to simulate no previous runs"""
+        """Return None to simulate no previous runs, unless resuming from the cache"""
+        if self.resume:
+            return self.run_cache.last_successful_run(source)
         return None
 
     async def record_run(self, run_document: ScraperRunDocument) -> None:
         """Update the runs section of the output file"""
-        data = self._read_json()
-
         # Convert run document to dict and handle datetime serialization
         run_dict = run_document.model_dump(exclude_none=True)
+        self.run_cache.record(run_document)
+
+        if self.writer:
+            # Runs go next to the documents, identified by type "scraper_run"
+            self.writer.write([run_dict])
+            self.writer.flush()
+            return
+
+        data = self._read_json()
 
         # Update runs array - keeping just the latest run for now
         data["runs"] = [run_dict]
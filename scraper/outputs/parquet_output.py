@@ -0,0 +1,195 @@
+import asyncio
+import os
+import re
+import types
+from datetime import datetime
+from pathlib import Path
+from functools import lru_cache
+from typing import (
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from loguru import logger
+from pydantic import BaseModel
+
+from scraper.models import ScrapedDocument, ScraperRunDocument
+from scraper.outputs import AbstractOutput
+from scraper.outputs.elasticsearch_mapping import DOCUMENT_MODELS
+from scraper.outputs.run_cache import RunCache
+from scraper.config import settings
+from scraper.registry import output_registry
+from scraper.utils import slugify
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+
+def arrow_type(annotation) -> "pa.DataType":
+    """Map a pydantic field annotation to an Arrow type."""
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return arrow_type(args[0]) if len(args) == 1 else pa.string()
+    if origin in (list, List):
+        (item,) = get_args(annotation)
+        return pa.list_(arrow_type(item))
+    if origin is Literal:
+        return pa.string()
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return pa.struct(
+            [
+                pa.field(name, arrow_type(field.annotation))
+                for name, field in annotation.model_fields.items()
+            ]
+        )
+    return {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float32(),
+        str: pa.string(),
+    }.get(annotation, pa.string())
+
+
+def arrow_schema(document_class: Type[BaseModel]) -> "pa.Schema":
+    """Build the Arrow schema of a document model, keeping nested fields as lists/structs."""
+    return pa.schema(
+        [
+            pa.field(name, arrow_type(field.annotation))
+            for name, field in document_class.model_fields.items()
+        ]
+    )
+
+
+@lru_cache(maxsize=None)
+def documents_schema() -> "pa.Schema":
+    """
+    Arrow schema shared by every partition.
+
+    Holds the fields of all document models (e.g. GitHub `reviews`), so files
+    written for different document types and batches can be read back as one
+    dataset. A field typed differently by two models is stored as a string.
+    """
+    fields: Dict[str, "pa.Field"] = {}
+    for document_class in DOCUMENT_MODELS:
+        for field in arrow_schema(document_class):
+            if field.name in fields and fields[field.name].type != field.type:
+                fields[field.name] = pa.field(field.name, pa.string())
+            else:
+                fields.setdefault(field.name, field)
+    return pa.schema(list(fields.values()))
+
+
+def arrow_row(document: ScrapedDocument, schema: "pa.Schema") -> Dict:
+    """Dump a document, turning scalars stored in widened string fields into strings."""
+    row = document.model_dump()
+    for name, value in row.items():
+        if isinstance(value, (int, float)) and schema.field(name).type == pa.string():
+            row[name] = str(value)
+    return row
+
+
+@output_registry.register("parquet")
+class ParquetOutput(AbstractOutput):
+    """
+    Writes documents to partitioned Parquet files for offline analysis.
+
+    Files are laid out as
+    `<parquet_output_dir>/<index>/source_name=<source>/month=<YYYY-MM>/part-<run>.parquet`,
+    with one row group per flushed batch. The partition key is not `source`,
+    which is already a column of the documents. Each run writes new part files, so
+    re-scraped documents appear once per run; deduplicate on `id` (keeping the
+    latest `indexed_at`) when reading. Run documents are kept in `_runs.jsonl`
+    next to the partitions.
+
+    Requires the `parquet` extra (`poetry install --extras parquet`).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.output_dir = Path(
+            settings.config.get(
+                "parquet_output_dir", os.path.join(settings.DATA_DIR, "parquet")
+            ),
+            slugify(self.index_name),
+        )
+        self.run_cache = RunCache("_runs", cache_dir=self.output_dir)
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.writers: Dict[Tuple[str, str], "pq.ParquetWriter"] = {}
+        self._write_lock = asyncio.Lock()
+
+    async def _initialize(self):
+        if pa is None:
+            raise ImportError(
+                "The parquet output requires the 'pyarrow' package: "
+                "poetry install --extras parquet"
+            )
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    async def _cleanup(self):
+        for writer in self.writers.values():
+            writer.close()
+        if self.writers:
+            logger.info(
+                f"Parquet output written to {self.output_dir} ({len(self.writers)} partitions)"
+            )
+        self.writers.clear()
+
+    def _partition(self, document: ScrapedDocument) -> Tuple[str, str]:
+        """Return the (source, month) partition of a document."""
+        source = slugify(self.source or document.domain)
+        match = re.match(r"\d{4}-\d{2}", document.created_at or "")
+        return source, match.group(0) if match else "unknown"
+
+    def _writer(self, partition: Tuple[str, str]):
+        if partition not in self.writers:
+            source, month = partition
+            path = (
+                self.output_dir
+                / f"source_name={source}"
+                / f"month={month}"
+                / f"part-{self.run_id}.parquet"
+            )
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.writers[partition] = pq.ParquetWriter(path, documents_schema())
+        return self.writers[partition]
+
+    def _write_partitions(self, documents: List[ScrapedDocument]):
+        """Group a batch by partition and append it as a row group to each file."""
+        partitions: Dict[Tuple[str, str], List[ScrapedDocument]] = {}
+        for doc in documents:
+            partitions.setdefault(self._partition(doc), []).append(doc)
+
+        for partition, docs in partitions.items():
+            schema = documents_schema()
+            table = pa.Table.from_pylist(
+                [arrow_row(doc, schema) for doc in docs], schema=schema
+            )
+            self._writer(partition).write_table(table)
+
+    async def _index_batch(
+        self, documents: List[ScrapedDocument], payloads: List[bytes]
+    ):
+        """Write a batch of documents, off the event loop"""
+        async with self._write_lock:
+            await asyncio.to_thread(self._write_partitions, documents)
+
+    async def get_last_successful_run(
+        self, source: str
+    ) -> Optional[ScraperRunDocument]:
+        """Return the latest successful run recorded in `_runs.jsonl`"""
+        return self.run_cache.last_successful_run(source)
+
+    async def record_run(self, run_document: ScraperRunDocument) -> None:
+        """Append the run document to `_runs.jsonl`"""
+        self.run_cache.record(run_document)
@@ -0,0 +1,56 @@
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from scraper.config import settings
+from scraper.models import ScraperRunDocument
+from scraper.outputs.jsonl import JsonlWriter, read_jsonl
+from scraper.utils import slugify
+
+
+def default_run_cache_dir() -> Path:
+    """Directory where outputs keep a local copy of their run documents."""
+    return Path(
+        settings.config.get("run_cache_dir", os.path.join(settings.DATA_DIR, "runs"))
+    )
+
+
+class RunCache:
+    """
+    Local append-only log of run documents, kept as `<name>.jsonl`.
+
+    Answers run lookups without a backend: outputs use it as a fallback when
+    their store is unreachable, and file-based outputs as their run store.
+    """
+
+    def __init__(self, name: str, cache_dir: Path = None):
+        self.base_path = Path(cache_dir or default_run_cache_dir(), name)
+
+    @classmethod
+    def for_index(cls, index_name: str) -> "RunCache":
+        return cls(slugify(index_name))
+
+    def record(self, run_document: ScraperRunDocument):
+        """Append a run document to the log."""
+        with JsonlWriter(self.base_path) as writer:
+            writer.write([run_document.model_dump(exclude_none=True)])
+
+    def runs(
+        self, source: str, must_terms: Dict[str, Any] = None, size: int = 1
+    ) -> List[ScraperRunDocument]:
+        """Return the latest runs of a source matching all `must_terms`."""
+        path = self.base_path.with_name(f"{self.base_path.name}.jsonl")
+        if not path.exists():
+            return []
+        runs = [
+            ScraperRunDocument(**run)
+            for run in read_jsonl(path)
+            if run["source"].lower() == source.lower()
+            and all(run.get(k) == v for k, v in (must_terms or {}).items())
+        ]
+        runs.sort(key=lambda run: run.finished_at, reverse=True)
+        return runs[:size]
+
+    def last_successful_run(self, source: str) -> Optional[ScraperRunDocument]:
+        runs = self.runs(source, {"success": True})
+        return runs[0] if runs else None
@@ -0,0 +1,199 @@
+import asyncio
+import json
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from scraper.models import ScrapedDocument, ScraperRunDocument
+from scraper.outputs import AbstractOutput
+from scraper.config import settings
+from scraper.registry import output_registry
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    body TEXT,
+    authors TEXT,
+    domain TEXT,
+    url TEXT,
+    type TEXT,
+    created_at TEXT,
+    indexed_at TEXT,
+    content_hash TEXT,
+    document TEXT
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, body, authors, content='documents', content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+    INSERT INTO documents_fts(rowid, title, body, authors)
+    VALUES (new.rowid, new.title, new.body, new.authors);
+END;
+
+CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, title, body, authors)
+    VALUES ('delete', old.rowid, old.title, old.body, old.authors);
+END;
+
+CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+    INSERT INTO documents_fts(documents_fts, rowid, title, body, authors)
+    VALUES ('delete', old.rowid, old.title, old.body, old.authors);
+    INSERT INTO documents_fts(rowid, title, body, authors)
+    VALUES (new.rowid, new.title, new.body, new.authors);
+END;
+
+CREATE TABLE IF NOT EXISTS runs (
+    source TEXT,
+    finished_at TEXT,
+    success INTEGER,
+    document TEXT
+);
+
+CREATE INDEX IF NOT EXISTS runs_source ON runs (source, success, finished_at);
+"""
+
+# Unchanged documents (same content hash) are left untouched by the upsert
+UPSERT = """
+INSERT INTO documents
+    (id, title, body, authors, domain, url, type, created_at, indexed_at, content_hash, document)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title,
+    body = excluded.body,
+    authors = excluded.authors,
+    domain = excluded.domain,
+    url = excluded.url,
+    type = excluded.type,
+    created_at = excluded.created_at,
+    indexed_at = excluded.indexed_at,
+    content_hash = excluded.content_hash,
+    document = excluded.document
+WHERE documents.content_hash IS NOT excluded.content_hash
+"""
+
+SEARCH = """
+SELECT d.id, d.title, d.url, d.authors, d.created_at,
+       bm25(documents_fts, 10.0, 1.0, 5.0) AS score,
+       snippet(documents_fts, 1, '[', ']', '...', 16) AS snippet
+FROM documents_fts
+JOIN documents d ON d.rowid = documents_fts.rowid
+WHERE documents_fts MATCH ?
+ORDER BY score
+LIMIT ?
+"""
+
+
+def default_database_path(index_name: str) -> str:
+    """Location of the SQLite database used for an index."""
+    return settings.config.get(
+        "sqlite_output_path", os.path.join(settings.DATA_DIR, f"{index_name}.sqlite")
+    )
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open (and create if needed) a local document database in WAL mode."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def search_documents(
+    conn: sqlite3.Connection, query: str, limit: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Run a full-text query, ranked by BM25 (title and authors weigh more than body).
+
+    The query uses FTS5 syntax, e.g. `taproot AND "schnorr signatures"`.
+    """
+    return [dict(row) for row in conn.execute(SEARCH, (query, limit))]
+
+
+@output_registry.register("sqlite")
+class SqliteOutput(AbstractOutput):
+    """
+    Stores documents in a single local SQLite file with an FTS5 index over
+    title, body and authors.
+
+    A zero-service stand-in for Elasticsearch during development: each batch is
+    written in one transaction, and documents whose content hash is unchanged
+    are not rewritten. Search it with `scraper local search`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.database_path = default_database_path(self.index_name)
+        self.conn: Optional[sqlite3.Connection] = None
+        self._write_lock = asyncio.Lock()
+
+    async def _initialize(self):
+        """Open the database"""
+        self.conn = connect(self.database_path)
+
+    async def _cleanup(self):
+        """Close the database"""
+        if self.conn:
+            self.conn.close()
+            logger.info(f"SQLite output written to {self.database_path}")
+
+    def _write(self, documents: List[ScrapedDocument], payloads: List[bytes]) -> int:
+        """Upsert a batch in a single transaction and return the rows written."""
+        rows = [
+            (
+                doc.id,
+                doc.title,
+                doc.body,
+                ", ".join(doc.authors or []),
+                doc.domain,
+                doc.url,
+                doc.type,
+                doc.created_at,
+                doc.indexed_at,
+                doc.content_hash,
+                payload.decode("utf-8"),
+            )
+            for doc, payload in zip(documents, payloads)
+        ]
+        with self.conn:
+            cursor = self.conn.executemany(UPSERT, rows)
+        return cursor.rowcount
+
+    async def _index_batch(
+        self, documents: List[ScrapedDocument], payloads: List[bytes]
+    ):
+        """Write a batch of documents, off the event loop"""
+        async with self._write_lock:
+            written = await asyncio.to_thread(self._write, documents, payloads)
+        self.documents_skipped += len(documents) - written
+
+    async def get_last_successful_run(
+        self, source: str
+    ) -> Optional[ScraperRunDocument]:
+        """Return the latest successful run recorded for the source"""
+        row = self.conn.execute(
+            "SELECT document FROM runs WHERE source = ? AND success = 1 "
+            "ORDER BY finished_at DESC LIMIT 1",
+            (source.lower(),),
+        ).fetchone()
+        return ScraperRunDocument(**json.loads(row["document"])) if row else None
+
+    async def record_run(self, run_document: ScraperRunDocument) -> None:
+        """Record statistics for a scraper run"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO runs (source, finished_at, success, document) VALUES (?, ?, ?, ?)",
+                (
+                    run_document.source.lower(),
+                    run_document.finished_at,
+                    int(run_document.success),
+                    run_document.model_dump_json(exclude_none=True),
+                ),
+            )
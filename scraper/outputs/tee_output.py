@@ -0,0 +1,123 @@
+import asyncio
+from contextlib import AsyncExitStack
+from typing import List, Optional
+
+from scraper.models import ScrapedDocument, ScraperRunDocument
+from scraper.outputs import AbstractOutput
+
+
+class TeeOutput(AbstractOutput):
+    """
+    Fans documents out to several outputs in a single scrape pass.
+
+    Every sink keeps its own buffer, batching limits, flush workers and
+    failures; the tee only forwards documents and runs the sinks' flushes
+    concurrently. Each sink records the run with its own failed/skipped
+    counts. Built by ScraperFactory when more than one `--output` is given.
+    """
+
+    def __init__(self, sinks: List[AbstractOutput], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sinks = sinks
+        self._exit_stack: Optional[AsyncExitStack] = None
+
+    async def __aenter__(self):
+        self._exit_stack = AsyncExitStack()
+        try:
+            for sink in self.sinks:
+                await self._exit_stack.enter_async_context(sink)
+        except Exception:
+            await self._exit_stack.aclose()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await self.drain()
+        finally:
+            await self._exit_stack.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _initialize(self):
+        """Sinks are initialized when the tee is entered"""
+        pass
+
+    async def _cleanup(self):
+        """Sinks are cleaned up when the tee is exited"""
+        pass
+
+    async def index_document(self, document: ScrapedDocument):
+        """Hand the document to every sink's buffer"""
+        await asyncio.gather(*(sink.index_document(document) for sink in self.sinks))
+
+    async def flush_buffer(self):
+        await asyncio.gather(*(sink.flush_buffer() for sink in self.sinks))
+
+    async def drain(self):
+        await asyncio.gather(*(sink.drain() for sink in self.sinks))
+
+    async def start_bulk_load(self):
+        await asyncio.gather(*(sink.start_bulk_load() for sink in self.sinks))
+
+    async def end_bulk_load(self):
+        await asyncio.gather(*(sink.end_bulk_load() for sink in self.sinks))
+
+    async def _index_batch(
+        self, documents: List[ScrapedDocument], payloads: List[bytes]
+    ):
+        """Write a batch to every sink, each with its own serialization"""
+        await asyncio.gather(
+            *(
+                sink._write_batch(
+                    documents, [sink.serialize_document(doc) for doc in documents]
+                )
+                for sink in self.sinks
+            )
+        )
+
+    async def get_last_successful_run(
+        self, source: str
+    ) -> Optional[ScraperRunDocument]:
+        """
+        Return the oldest of the sinks' last successful runs.
+
+        Resuming from the oldest run guarantees no sink misses changes; if any
+        sink has no successful run, the source is scraped in full.
+        """
+        runs = await asyncio.gather(
+            *(sink.get_last_successful_run(source) for sink in self.sinks)
+        )
+        if not runs or any(run is None for run in runs):
+            return None
+        return min(runs, key=lambda run: run.finished_at)
+
+    async def record_run(self, run_document: ScraperRunDocument) -> None:
+        """
+        Record the run in every sink with that sink's own counts.
+
+        The tee writes nothing itself, so the run's `documents_indexed` is the
+        number of documents handed to each sink.
+        """
+        await asyncio.gather(
+            *(
+                sink.record_run(
+                    run_document.model_copy(
+                        update={
+                            "stats": run_document.stats.model_copy(
+                                update={
+                                    "documents_indexed": max(
+                                        (run_document.stats.documents_indexed or 0)
+                                        - len(sink.failures)
+                                        - sink.documents_skipped,
+                                        0,
+                                    ),
+                                    "documents_failed": len(sink.failures),
+                                    "documents_skipped": sink.documents_skipped,
+                                }
+                            ),
+                            "bulk_load": sink.bulk_load,
+                        }
+                    )
+                )
+                for sink in self.sinks
+            )
+        )
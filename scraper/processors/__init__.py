@@ -1,5 +1,6 @@
 from .processor_manager import ProcessorManager
 from .base_processor import BaseProcessor
+from .author_synonyms_processor import AuthorSynonymsProcessor
 from .summarization_processor import SummarizationProcessor
 from .topic_extractor_processor import TopicExtractorProcessor
 from .vector_embeddings_processor import VectorEmbeddingsProcessor
@@ -7,6 +8,7 @@ from .vector_embeddings_processor import VectorEmbeddingsProcessor
 __all__ = [
     "ProcessorManager",
     "BaseProcessor",
+    "AuthorSynonymsProcessor",
     "SummarizationProcessor",
     "TopicExtractorProcessor",
     "VectorEmbeddingsProcessor",
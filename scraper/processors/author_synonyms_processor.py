@@ -0,0 +1,103 @@
+import csv
+import io
+import urllib.request
+from ast import literal_eval
+from pathlib import Path
+from typing import Dict
+
+from loguru import logger
+
+from scraper.config import settings
+from scraper.models import ScrapedDocument
+from .base_processor import BaseProcessor
+from scraper.registry import processor_registry
+
+# Same list used by the `update_authors_synonyms.py` index rewrite
+DEFAULT_SYNONYMS_URL = (
+    "https://raw.githubusercontent.com/bitcoinsearch/synonyms/main/authors-synonyms.csv"
+)
+
+
+def normalize_name(name: str) -> str:
+    """Lookup key of an author name: case-folded, whitespace collapsed."""
+    return " ".join(name.split()).casefold()
+
+
+def parse_synonyms(text: str) -> Dict[str, str]:
+    """
+    Parse the synonyms CSV into a lookup from normalized name to canonical name.
+
+    Each row lists the canonical name first, followed by its aliases. The
+    canonical name is included too, so differently cased spellings of it are
+    normalized as well.
+    """
+    lookup = {}
+    for row in csv.reader(io.StringIO(text)):
+        if not row:
+            continue
+        canonical = row[0].strip()
+        for name in row:
+            try:
+                name = literal_eval(name.strip())
+            except (ValueError, SyntaxError):
+                pass
+            # Coerced like update_authors_names_from_es, e.g. a name parsed as a number
+            name = str(name).strip()
+            if name:
+                lookup.setdefault(normalize_name(name), canonical)
+    return lookup
+
+
+# Synonyms loaded successfully, by location
+_synonyms_cache: Dict[str, Dict[str, str]] = {}
+
+
+def load_synonyms(location: str) -> Dict[str, str]:
+    """
+    Load the synonyms CSV from a URL or local path, once per process.
+
+    A failed load is not cached, so the next processor tries again.
+    """
+    if location in _synonyms_cache:
+        return _synonyms_cache[location]
+    try:
+        if Path(location).is_file():
+            text = Path(location).read_text(encoding="utf-8")
+        else:
+            with urllib.request.urlopen(location, timeout=30) as response:
+                text = response.read().decode("utf-8")
+    except (OSError, ValueError) as e:
+        logger.warning(
+            f"Could not load author synonyms from {location}: {e}. Authors are left unchanged."
+        )
+        return {}
+    lookup = _synonyms_cache[location] = parse_synonyms(text)
+    logger.info(f"Loaded {len(lookup)} author synonyms from {location}")
+    return lookup
+
+
+@processor_registry.register("author_synonyms")
+class AuthorSynonymsProcessor(BaseProcessor):
+    """
+    Replaces author aliases with their canonical names before indexing.
+
+    The synonyms CSV is read from `author_synonyms_csv` in `config.ini` (a URL
+    or local path, defaults to the bitcoinsearch synonyms list). Matching is
+    case-insensitive; authors without a synonym are kept as they are.
+    """
+
+    def __init__(self):
+        self.synonyms = load_synonyms(
+            settings.config.get("author_synonyms_csv", DEFAULT_SYNONYMS_URL)
+        )
+
+    async def process(self, document: ScrapedDocument) -> ScrapedDocument:
+        if document.authors and self.synonyms:
+            authors = []
+            for author in document.authors:
+                author = self.synonyms.get(normalize_name(author), author)
+                # Two aliases of the same person collapse into one author
+                if author not in authors:
+                    authors.append(author)
+            document.authors = authors
+        return document
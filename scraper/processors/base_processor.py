@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from scraper.models import ScrapedDocument
 
@@ -17,3 +17,39 @@ class BaseProcessor(ABC):
             Dict[ScrapedDocument]: The processed document.
         """
         pass
+
+    async def process_batch(
+        self, documents: List[ScrapedDocument]
+    ) -> List[ScrapedDocument]:
+        """
+        Process several documents at once.
+
+        Override this in processors that can work on a batch more efficiently
+        than one document at a time (e.g. vectorized inference). The default
+        processes the documents one by one with `process`.
+
+        Args:
+            documents (List[ScrapedDocument]): The documents to process.
+
+        Returns:
+            List[ScrapedDocument]: The processed documents, in the same order.
+        """
+        return [await self.process(document) for document in documents]
+
+    def run_stats(self) -> Dict[str, Any]:
+        """
+        Statistics of the processor's work, recorded with the run.
+
+        Returns:
+            Dict[str, Any]: Values for `RunStats` fields, empty by default.
+        """
+        return {}
+
+    async def close(self):
+        """Release resources held by the processor, once all documents are processed."""
+        pass
+
+    @property
+    def supports_batching(self) -> bool:
+        """Whether the processor overrides `process_batch`."""
+        return type(self).process_batch is not BaseProcessor.process_batch
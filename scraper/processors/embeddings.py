@@ -0,0 +1,183 @@
+import hashlib
+import os
+import re
+import sqlite3
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Dict, List
+
+import numpy as np
+
+from scraper.config import settings
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length; all-zero rows are left as they are."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class EmbeddingBackend(ABC):
+    """Turns a batch of texts into a (len(texts), dimensions) array."""
+
+    # Identifies the model in the embedding cache, so changing it never
+    # returns vectors computed by another model
+    model_id: str
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> np.ndarray:
+        pass
+
+
+class HashingEmbeddingBackend(EmbeddingBackend):
+    """
+    Deterministic hashing vectorizer over word unigrams and bigrams.
+
+    Needs no model download, which makes it suitable for tests and offline
+    runs; vectors only capture lexical overlap.
+    """
+
+    def __init__(self, dimensions: int = 384):
+        self.dimensions = dimensions
+        self.model_id = f"hashing-{dimensions}"
+
+    def features(self, text: str) -> List[str]:
+        words = re.findall(r"\w+", text.lower())
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            hashes = np.array(
+                [
+                    int.from_bytes(
+                        hashlib.blake2b(feature.encode(), digest_size=8).digest(),
+                        "little",
+                    )
+                    for feature in self.features(text)
+                ],
+                dtype=np.uint64,
+            )
+            if not len(hashes):
+                continue
+            # The top bit picks the sign, so colliding features tend to cancel out
+            signs = np.where(hashes >> np.uint64(63), 1.0, -1.0).astype(np.float32)
+            indices = (hashes % np.uint64(self.dimensions)).astype(np.intp)
+            np.add.at(vectors[row], indices, signs)
+        return vectors
+
+
+class SentenceTransformerBackend(EmbeddingBackend):
+    """
+    Local CPU model loaded with sentence-transformers.
+
+    Set `embedding_onnx = true` to run the model with ONNX Runtime.
+    """
+
+    def __init__(
+        self, model_name: str = DEFAULT_EMBEDDING_MODEL, onnx: bool = False
+    ):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "The sentence_transformers embedding backend requires the "
+                "'sentence-transformers' package: poetry install --extras embeddings "
+                "(or set embedding_backend = hashing)"
+            )
+        self.model_id = f"{model_name}{'-onnx' if onnx else ''}"
+        self.model = SentenceTransformer(
+            model_name, device="cpu", **({"backend": "onnx"} if onnx else {})
+        )
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        return self.model.encode(texts, batch_size=32, convert_to_numpy=True)
+
+
+EMBEDDING_BACKENDS = {
+    "sentence_transformers": SentenceTransformerBackend,
+    "hashing": HashingEmbeddingBackend,
+}
+
+
+@lru_cache(maxsize=None)
+def load_embedding_backend(name: str = None, model: str = None) -> EmbeddingBackend:
+    """
+    Create the embedding backend configured in `config.ini`, once per process.
+
+    `embedding_backend` selects the backend (default: sentence_transformers).
+    The hashing backend is only used when selected explicitly, so a missing
+    sentence-transformers install fails instead of mixing hashing vectors into
+    an index of model embeddings.
+    """
+    name = name or settings.config.get("embedding_backend", "sentence_transformers")
+    if name not in EMBEDDING_BACKENDS:
+        raise ValueError(
+            f"Unknown embedding backend: {name}. Use one of: {list(EMBEDDING_BACKENDS)}"
+        )
+    if name == "hashing":
+        return HashingEmbeddingBackend(
+            settings.config.getint("embedding_dimensions", 384)
+        )
+    return SentenceTransformerBackend(
+        model or settings.config.get("embedding_model", DEFAULT_EMBEDDING_MODEL),
+        onnx=settings.config.getboolean("embedding_onnx", False),
+    )
+
+
+def default_embedding_cache_path() -> str:
+    return settings.config.get(
+        "embedding_cache_path", os.path.join(settings.DATA_DIR, "embeddings.sqlite")
+    )
+
+
+class EmbeddingCache:
+    """
+    On-disk cache of normalized embeddings, in a SQLite file.
+
+    Entries are keyed by a hash of the model id and the embedded text, so an
+    unchanged text is only embedded once per model.
+    """
+
+    def __init__(self, model_id: str, path: str = None):
+        self.model_id = model_id
+        path = path or default_embedding_cache_path()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key TEXT PRIMARY KEY, model_id TEXT, vector BLOB)"
+        )
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_id}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        # Stay below SQLite's limit on the number of query parameters
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for key, vector in rows:
+                found[key] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def put_many(self, vectors: Dict[str, np.ndarray]):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, model_id, vector) VALUES (?, ?, ?)",
+                [
+                    (key, self.model_id, np.asarray(vector, dtype=np.float32).tobytes())
+                    for key, vector in vectors.items()
+                ],
+            )
+
+    def close(self):
+        self.conn.close()
@@ -1,13 +1,190 @@
-from typing import List
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
 from scraper.models import ScrapedDocument
 from .base_processor import BaseProcessor
 
 
+class MicroBatcher:
+    """
+    Groups documents sent to a batch-capable processor into micro-batches.
+
+    A batch is processed once it holds `batch_size` documents or its first
+    document has waited `max_wait` seconds. If `process_batch` fails, the
+    batch's documents are retried one by one so a single bad document only
+    fails itself.
+    """
+
+    def __init__(self, processor: BaseProcessor, batch_size: int, max_wait: float):
+        self.processor = processor
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[ScrapedDocument, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def process(self, document: ScrapedDocument) -> ScrapedDocument:
+        """Add a document to the current batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((document, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif len(self._pending) == 1:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[ScrapedDocument, asyncio.Future]]):
+        documents = [document for document, _ in batch]
+        try:
+            results = await self.processor.process_batch(documents)
+            if len(results) != len(documents):
+                raise ValueError(
+                    f"process_batch returned {len(results)} documents for {len(documents)}"
+                )
+        except Exception as e:
+            logger.warning(
+                f"{self.processor.__class__.__name__} failed on a batch of "
+                f"{len(documents)} documents ({e}), processing them one by one"
+            )
+            results = None
+        # A waiter may have been cancelled (e.g. with the scraper task), skip it
+        if results is None:
+            for document, future in batch:
+                if future.done():
+                    continue
+                try:
+                    result = await self.processor.process(document)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
 class ProcessorManager:
-    def __init__(self, processors: List[BaseProcessor]):
+    """
+    Applies a source's processors to its documents.
+
+    With `concurrency` above 1, documents handed to `submit` are processed in
+    background tasks, at most `concurrency` at a time, and may complete in any
+    order. A document whose processors raise is logged, counted in
+    `documents_failed` and dropped, without affecting the other documents.
+
+    In that mode, documents reaching a processor that implements
+    `process_batch` are grouped into micro-batches of up to `batch_size`
+    documents (default: `concurrency`), waiting at most `max_batch_wait`
+    seconds for a batch to fill.
+    """
+
+    def __init__(
+        self,
+        processors: List[BaseProcessor],
+        concurrency: int = 1,
+        batch_size: Optional[int] = None,
+        max_batch_wait: float = 0.1,
+    ):
         self.processors = processors
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size or self.concurrency)
+        self.max_batch_wait = max_batch_wait
+        self.documents_failed = 0
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._tasks: Set[asyncio.Task] = set()
+        # Batching only helps when several documents are in flight
+        self._batchers: Dict[int, MicroBatcher] = (
+            {
+                i: MicroBatcher(processor, self.batch_size, max_batch_wait)
+                for i, processor in enumerate(processors)
+                if processor.supports_batching
+            }
+            if self.concurrency > 1 and self.batch_size > 1
+            else {}
+        )
 
     async def process_document(self, document: ScrapedDocument) -> ScrapedDocument:
-        for processor in self.processors:
-            document = await processor.process(document)
+        for i, processor in enumerate(self.processors):
+            if i in self._batchers:
+                document = await self._batchers[i].process(document)
+            else:
+                document = await processor.process(document)
         return document
+
+    async def submit(
+        self,
+        document: ScrapedDocument,
+        on_processed: Callable[[ScrapedDocument], Awaitable[None]],
+    ):
+        """
+        Process a document in the background, then pass it to `on_processed`.
+
+        Waits only until one of the `concurrency` slots is free, which bounds
+        the number of documents held in memory by the scraper.
+        """
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._process_and_release(document, on_processed))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process_and_release(
+        self,
+        document: ScrapedDocument,
+        on_processed: Callable[[ScrapedDocument], Awaitable[None]],
+    ):
+        try:
+            try:
+                processed = await self.process_document(document)
+            except Exception as e:
+                self.documents_failed += 1
+                logger.error(f"Error processing document {document.id}: {e}")
+                logger.exception("Full traceback:")
+                return
+            await on_processed(processed)
+        finally:
+            self._semaphore.release()
+
+    async def join(self):
+        """
+        Wait for all submitted documents to be processed, then close the processors.
+
+        Errors raised while handing processed documents on (e.g. by the output)
+        are not isolated and are re-raised here.
+        """
+        try:
+            while self._tasks:
+                results = await asyncio.gather(*self._tasks, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        raise result
+        finally:
+            for processor in self.processors:
+                try:
+                    await processor.close()
+                except Exception as e:
+                    logger.error(
+                        f"Error closing {processor.__class__.__name__}: {e}"
+                    )
+
+    def run_stats(self) -> Dict[str, Any]:
+        """Merge the run statistics reported by the processors."""
+        stats: Dict[str, Any] = {}
+        for processor in self.processors:
+            stats.update(processor.run_stats())
+        return stats
@@ -0,0 +1,82 @@
+import re
+import time
+from collections import Counter
+from typing import List, Tuple
+
+import numpy as np
+
+# Sentence ends, unless followed by a lowercase word (e.g. "e.g. this")
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[^a-z\s])|\n\s*\n")
+WORD = re.compile(r"\w+")
+
+
+def split_sentences(text: str, min_words: int = 4) -> List[str]:
+    """Split text into sentences, dropping fragments shorter than `min_words`."""
+    sentences = (" ".join(s.split()) for s in SENTENCE_BOUNDARY.split(text))
+    return [s for s in sentences if len(WORD.findall(s)) >= min_words]
+
+
+def tfidf_matrix(sentences: List[str]) -> np.ndarray:
+    """Return the L2-normalized TF-IDF vectors of the sentences, one per row."""
+    tokens = [WORD.findall(sentence.lower()) for sentence in sentences]
+    words = sorted({word for sentence in tokens for word in sentence})
+    vocabulary = {word: i for i, word in enumerate(words)}
+    counts = np.zeros((len(sentences), len(vocabulary)), dtype=np.float32)
+    for row, sentence in enumerate(tokens):
+        for word, count in Counter(sentence).items():
+            counts[row, vocabulary[word]] = count
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(sentences)) / (1 + document_frequency)) + 1
+    vectors = counts / np.maximum(counts.sum(axis=1, keepdims=True), 1) * idf
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def textrank(
+    similarity: np.ndarray,
+    damping: float = 0.85,
+    max_iterations: int = 100,
+    tolerance: float = 1e-6,
+) -> np.ndarray:
+    """Score the nodes of a weighted similarity graph with PageRank."""
+    n = len(similarity)
+    weights = similarity.copy()
+    np.fill_diagonal(weights, 0)
+    totals = weights.sum(axis=1, keepdims=True)
+    # Sentences similar to no other one link to every sentence
+    transition = np.where(
+        totals > 0, weights / np.where(totals == 0, 1, totals), 1 / n
+    )
+    scores = np.full(n, 1 / n)
+    for _ in range(max_iterations):
+        updated = (1 - damping) / n + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tolerance:
+            return updated
+        scores = updated
+    return scores
+
+
+def summarize(text: str, sentences: int = 3, max_sentences: int = 500) -> str:
+    """
+    Return the `sentences` most central sentences of the text, in text order.
+
+    Only the first `max_sentences` sentences are ranked, which bounds the
+    quadratic similarity matrix of very long texts.
+    """
+    candidates = split_sentences(text)[:max_sentences]
+    if not candidates:
+        # No prose to rank (e.g. code or a list), keep the start of the text
+        return " ".join(text.split())[:200]
+    if len(candidates) <= sentences:
+        return " ".join(candidates)
+    vectors = tfidf_matrix(candidates)
+    scores = textrank(vectors @ vectors.T)
+    top = sorted(np.argsort(-scores, kind="stable")[:sentences])
+    return " ".join(candidates[i] for i in top)
+
+
+def timed_summarize(text: str, sentences: int = 3) -> Tuple[str, float]:
+    """Summarize and return the seconds spent; runs in the worker processes."""
+    started = time.perf_counter()
+    summary = summarize(text, sentences)
+    return summary, time.perf_counter() - started
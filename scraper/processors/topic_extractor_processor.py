@@ -1,6 +1,7 @@
 import json
+from collections import Counter, deque
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple, Union
 from loguru import logger
 
 from scraper.config import get_project_root
@@ -9,12 +10,96 @@ from .base_processor import BaseProcessor
 from scraper.registry import processor_registry
 
 
+def is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def normalize_whitespace(text: str) -> str:
+    """Lowercase the text and collapse each run of whitespace into one space."""
+    return " ".join(text.split()).lower()
+
+
+class TopicMatcher:
+    """
+    Aho-Corasick automaton finding all topic names and aliases in one pass.
+
+    Matching is case-insensitive and only whole words count, so "tap" does not
+    match inside "taproot". Runs of whitespace are collapsed in both patterns
+    and text, so a multi-word topic still matches across a line break. Built
+    once from a mapping of pattern to topic.
+    """
+
+    def __init__(self, patterns: Dict[str, str]):
+        # State 0 is the root; each state maps a character to the next state
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # (pattern length, topic) of every pattern ending at a state
+        self.outputs: List[List[Tuple[int, str]]] = [[]]
+
+        for pattern, topic in patterns.items():
+            pattern = normalize_whitespace(pattern)
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                if char not in self.transitions[state]:
+                    self.transitions.append({})
+                    self.fail.append(0)
+                    self.outputs.append([])
+                    self.transitions[state][char] = len(self.transitions) - 1
+                state = self.transitions[state][char]
+            self.outputs[state].append((len(pattern), topic))
+
+        # Breadth-first, so the failure state of a node is always built first
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.transitions[fallback].get(char, 0)
+                self.outputs[next_state] += self.outputs[self.fail[next_state]]
+
+    def count(self, text: str) -> Counter:
+        """Count the whole-word hits of each topic in the text."""
+        text = normalize_whitespace(text)
+        hits = Counter()
+        state = 0
+        for end, char in enumerate(text, start=1):
+            while state and char not in self.transitions[state]:
+                state = self.fail[state]
+            state = self.transitions[state].get(char, 0)
+            if not self.outputs[state]:
+                continue
+            if end < len(text) and is_word_char(text[end]):
+                continue
+            for length, topic in self.outputs[state]:
+                start = end - length
+                if start == 0 or not is_word_char(text[start - 1]):
+                    hits[topic] += 1
+        return hits
+
+
 @processor_registry.register("topic_extractor")
 class TopicExtractorProcessor(BaseProcessor):
+    """
+    Tags documents with the topics of `topics_list.json` they mention most.
+
+    Topics are listed either by name or with aliases that count as mentions
+    of the topic:
+
+        {"topics": ["Taproot", {"name": "Lightning Network", "aliases": ["LN"]}]}
+    """
+
+    max_topics = 5
+
     def __init__(self):
         self.topics_list = self.load_topics()
+        self.matcher = TopicMatcher(self.topic_patterns(self.topics_list))
 
-    def load_topics(self) -> List[str]:
+    def load_topics(self) -> List[Union[str, Dict]]:
         topics_path = Path(get_project_root()) / "processors" / "topics_list.json"
         try:
             with open(topics_path, "r") as f:
@@ -35,12 +120,24 @@ class TopicExtractorProcessor(BaseProcessor):
             )
             return []
 
+    @staticmethod
+    def topic_patterns(topics: List[Union[str, Dict]]) -> Dict[str, str]:
+        """Map each topic name and alias to the topic it refers to."""
+        patterns = {}
+        for topic in topics:
+            if isinstance(topic, str):
+                name, aliases = topic, []
+            else:
+                name, aliases = topic["name"], topic.get("aliases", [])
+            for pattern in [name, *aliases]:
+                patterns.setdefault(normalize_whitespace(pattern), name)
+        return patterns
+
     async def process(self, document: ScrapedDocument) -> ScrapedDocument:
-        # Placeholder logic - replace with actual topic extraction
         if document.body:
+            hits = self.matcher.count(document.body)
+            # Counter.most_common keeps first-seen order between equal counts
             document.tags = [
-                topic
-                for topic in self.topics_list
-                if topic.lower() in document.body.lower()
-            ][:5]
+                topic for topic, _ in hits.most_common(self.max_topics)
+            ]
         return document
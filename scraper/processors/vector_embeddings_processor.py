@@ -1,15 +1,60 @@
+import asyncio
+from typing import List
+
+import numpy as np
+
 from scraper.models import ScrapedDocument
 from .base_processor import BaseProcessor
+from .embeddings import EmbeddingCache, l2_normalize, load_embedding_backend
 from scraper.registry import processor_registry
 
 
 @processor_registry.register("vector_embeddings")
 class VectorEmbeddingsProcessor(BaseProcessor):
+    """
+    Embeds document summaries into `summary_vector_embeddings`.
+
+    Vectors come from the configured embedding backend (see
+    scraper.processors.embeddings), L2-normalized, and are cached on disk by
+    text and model, so re-scraping an unchanged document reuses its vector.
+    A summary embedded as the zero vector (e.g. one with no words for the
+    hashing backend) gets no embedding, since cosine similarity is undefined
+    for it and Elasticsearch rejects it.
+    """
+
+    def __init__(self):
+        self.backend = load_embedding_backend()
+        self.cache = EmbeddingCache(self.backend.model_id)
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        """Return the normalized embeddings of the texts, computing only cache misses."""
+        keys = [self.cache.key(text) for text in texts]
+        vectors = self.cache.get_many(keys)
+        missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        if missing:
+            # Model inference is CPU-bound, keep it off the event loop
+            computed = l2_normalize(
+                await asyncio.to_thread(self.backend.embed, list(missing.values()))
+            )
+            new_vectors = dict(zip(missing, computed))
+            self.cache.put_many(new_vectors)
+            vectors.update(new_vectors)
+        return np.stack([vectors[key] for key in keys])
+
     async def process(self, document: ScrapedDocument) -> ScrapedDocument:
-        # Placeholder logic - replace with actual vector embedding generation
-        if document.summary:
-            # This is just a dummy representation, not a real embedding
-            document.summary_vector_embeddings = [
-                float(ord(c)) for c in document.summary[:10]
-            ]
-        return document
+        return (await self.process_batch([document]))[0]
+
+    async def process_batch(
+        self, documents: List[ScrapedDocument]
+    ) -> List[ScrapedDocument]:
+        to_embed = [document for document in documents if document.summary]
+        if to_embed:
+            vectors = await self.embed([document.summary for document in to_embed])
+            for document, vector in zip(to_embed, vectors):
+                document.summary_vector_embeddings = (
+                    vector.tolist() if np.any(vector) else None
+                )
+        return documents
+
+    async def close(self):
+        self.cache.close()
@@ -1,5 +1,8 @@
+from typing import Sequence, Union
+
 from loguru import logger
 
+from scraper.outputs import AbstractOutput, TeeOutput
 from scraper.processors import ProcessorManager
 from scraper.scrapers import BaseScraper
 from scraper.models import SourceConfig
@@ -12,19 +15,45 @@ class ScraperFactory:
     The ScraperFactory is responsible for creating the appropriate scraper for each source:
     1. It looks up the appropriate scraper from the registry based on the source name.
     2. Processors specified in the source configuration are instantiated from the processor registry.
-    3. The selected output method is created from the output registry.
+    3. The selected output method is created from the output registry. When several
+       outputs are selected, they are combined in a TeeOutput.
 
     This design allows for easy addition of new scrapers without modifying existing code.
     """
 
     @staticmethod
-    def create_scraper(source: SourceConfig, output_type: str) -> BaseScraper:
+    def create_output(output_type: str, source: SourceConfig) -> AbstractOutput:
+        """
+        Creates the output handler registered under the given name.
+
+        Args:
+            output_type: Name of a registered output
+            source: The configuration for the source to be scraped
+        """
+        output_class = output_registry.get(output_type)
+        return output_class(
+            index_name=settings.DEFAULT_INDEX,
+            batch_size=settings.config.getint("batch_size", 100),
+            max_in_flight=settings.config.getint("max_in_flight_batches", 1),
+            queue_size=settings.config.getint("flush_queue_size", 2),
+            max_batch_bytes=settings.config.getint(
+                "max_batch_bytes", 10 * 1024 * 1024
+            ),
+            max_batch_latency=settings.config.getfloat("max_batch_latency", 5.0),
+            source=source.name,
+        )
+
+    @staticmethod
+    def create_scraper(
+        source: SourceConfig, output_type: Union[str, Sequence[str]]
+    ) -> BaseScraper:
         """
         Creates and returns an instance of the appropriate scraper for the given source.
 
         Args:
             source: The configuration for the source to be scraped
-            output_type: The output handler for the scraped data
+            output_type: The output handler for the scraped data. When several
+                outputs are given, documents are written to all of them in the same pass.
 
         Returns:
             BaseScraper: An instance of the appropriate scraper for the source
@@ -38,18 +67,30 @@ class ScraperFactory:
                 processor_class = processor_registry.get(proc_name)
                 processors.append(processor_class())
 
-            processor_manager = ProcessorManager(processors)
+            processor_manager = ProcessorManager(
+                processors,
+                concurrency=source.processing_concurrency,
+                batch_size=source.processing_batch_size,
+                max_batch_wait=source.processing_batch_wait,
+            )
 
             # Create the output handler
-            output_class = output_registry.get(output_type)
-            output = output_class(
-                index_name=settings.DEFAULT_INDEX,
-                batch_size=settings.config.getint("batch_size", 100),
+            output_types = (
+                [output_type] if isinstance(output_type, str) else output_type
             )
+            outputs = [
+                ScraperFactory.create_output(name, source) for name in output_types
+            ]
+            if len(outputs) == 1:
+                output = outputs[0]
+            else:
+                output = TeeOutput(
+                    outputs, index_name=settings.DEFAULT_INDEX, source=source.name
+                )
 
             scraper = scraper_class(source, output, processor_manager)
             logger.debug(
-                f"Scrapping {source.name} ({source.domain}) to {output.__class__.__name__} using {scraper.__class__.__name__} ({[processor.__class__.__name__ for processor in processor_manager.processors]})..."
+                f"Scrapping {source.name} ({source.domain}) to {[o.__class__.__name__ for o in outputs]} using {scraper.__class__.__name__} ({[processor.__class__.__name__ for processor in processor_manager.processors]})..."
             )
             return scraper
         except Exception as e:
@@ -7,6 +7,7 @@ from loguru import logger
 from scraper.models import RunStats, ScraperRunDocument, ScrapedDocument, SourceConfig
 from scraper.outputs import AbstractOutput
 from scraper.processors import ProcessorManager
+from scraper.utils import normalize_domain
 
 
 class BaseScraper(ABC):
@@ -53,8 +54,7 @@ class BaseScraper(ABC):
         Returns:
             SourceConfig: Configuration with normalized URLs.
         """
-        # Simple normalization: remove trailing slash if present, then add it
-        domain = str(config.domain).rstrip("/") + "/"
+        domain = normalize_domain(config.domain)
 
         # Create new config with normalized domain
         config_dict = config.model_dump()
@@ -76,12 +76,25 @@ class BaseScraper(ABC):
         Process a single document through the processor manager and index it.
 
         This method applies all registered processors to the document and then
-        indexes the processed document using the output handler.
+        indexes the processed document using the output handler. Full batches
+        are written in the background, so this only waits when the output's
+        flush queue is full.
+
+        When the source sets `processing_concurrency`, the document is processed
+        in the background and this only waits for a free processing slot.
 
         Args:
             document (ScrapedDocument): The document to process and index.
         """
-        processed_doc = await self.processor_manager.process_document(document)
+        document.source = self.config.name
+        if self.processor_manager.concurrency > 1:
+            await self.processor_manager.submit(document, self._index_processed)
+        else:
+            processed_doc = await self.processor_manager.process_document(document)
+            await self._index_processed(processed_doc)
+
+    async def _index_processed(self, processed_doc: ScrapedDocument):
+        """Hand a processed document to the output handler."""
         await self.output.index_document(processed_doc)
         self.total_documents_processed += 1
         logger.info(
@@ -105,6 +118,18 @@ class BaseScraper(ABC):
                 self._error = str(e)
                 raise
             finally:
+                try:
+                    await self.processor_manager.join()
+                except Exception as e:
+                    self._success = False
+                    self._error = self._error or str(e)
+                    logger.error(f"Error processing documents: {e}")
+                # Wait for pending batches so the run stats include their failures
+                await self.output.drain()
+                try:
+                    await self.output.end_bulk_load()
+                except Exception as e:
+                    logger.error(f"Error ending bulk load: {e}")
                 await self.record_run()
 
     async def get_last_successful_run(self) -> Optional[ScraperRunDocument]:
@@ -118,9 +143,19 @@ class BaseScraper(ABC):
         Record statistics for the current scraper run.
         """
         try:
+            # Documents handed to the output, minus those it did not write
+            documents_indexed = (
+                self.total_documents_processed
+                - len(self.output.failures)
+                - self.output.documents_skipped
+            )
             stats = RunStats(
                 resources_to_process=self.resources_to_process,
-                documents_indexed=self.total_documents_processed,
+                documents_indexed=max(documents_indexed, 0),
+                documents_failed=len(self.output.failures),
+                documents_skipped=self.output.documents_skipped,
+                documents_failed_processing=self.processor_manager.documents_failed,
+                **self.processor_manager.run_stats(),
             )
 
             run_document = ScraperRunDocument(
@@ -132,6 +167,7 @@ class BaseScraper(ABC):
                 started_at=self._started_at,
                 success=self._success,
                 error_message=self._error,
+                bulk_load=self.output.bulk_load,
             )
 
             await self.output.record_run(run_document)
@@ -66,6 +66,9 @@ class GithubScraper(BaseScraper):
                 f"Running in full mode: {last_commit_hash} -> {self.current_commit_hash}"
             )
             files_to_process = self.get_changed_files(repo, last_commit_hash)
+            if not last_commit_hash:
+                # Every file is (re)indexed, tune the output for a backfill
+                await self.output.start_bulk_load()
 
         # Process files
         self.resources_to_process = len(files_to_process)
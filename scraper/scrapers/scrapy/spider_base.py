@@ -1,4 +1,5 @@
 from abc import ABC
+import asyncio
 import json
 from pathlib import Path
 import re
@@ -414,4 +415,9 @@ class BaseSpider(scrapy.Spider, SelectorExtractor, ABC):
     def process_document(self, response: Response, document: ScrapedDocument):
         """Process and index a document using the parent scraper."""
         logger.info(f"Processing document: {document.id}")
-        yield self.scraper.process_and_index_document(document)
+        # Run the coroutine as an asyncio task (as cli.run_in_reactor does) so
+        # it can wait on asyncio primitives: the output's bounded flush queue
+        # and the processor manager's concurrency slots
+        yield defer.Deferred.fromFuture(
+            asyncio.ensure_future(self.scraper.process_and_index_document(document))
+        )
@@ -30,6 +30,11 @@ def slugify(value: str) -> str:
     return value.strip("-").lower()
 
 
+def normalize_domain(domain) -> str:
+    """Return the domain URL with exactly one trailing slash, as documents store it."""
+    return str(domain).rstrip("/") + "/"
+
+
 def strip_emails(text: str) -> str:
     """Remove email addresses from the given text."""
     return re.sub(r"<.*?>", "", text).strip()
@@ -0,0 +1,10 @@
+import pytest
+
+from scraper.config import settings
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Keep the files outputs write (run caches, dead letters) out of the repo."""
+    monkeypatch.setattr(settings, "DATA_DIR", str(tmp_path / "data"))
+    return tmp_path / "data"
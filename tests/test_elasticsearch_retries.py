@@ -0,0 +1,87 @@
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+import scraper.outputs.elasticsearch_output as elasticsearch_output
+from scraper.models import ScrapedDocument
+from scraper.outputs import ElasticsearchOutput
+
+
+def document(doc_id: str) -> ScrapedDocument:
+    return ScrapedDocument(
+        id=doc_id,
+        title="title",
+        body="body",
+        domain="https://example.org/",
+        url=f"https://example.org/{doc_id}",
+    )
+
+
+class FakeBulk:
+    """Stands in for streaming_bulk, failing ids with the scripted statuses."""
+
+    def __init__(self, statuses: Dict[str, List[int]]):
+        # Status returned for an id on each successive attempt (200 when exhausted)
+        self.statuses = statuses
+        self.requests: List[List[str]] = []
+
+    def __call__(self, client, actions, **kwargs):
+        ids = [action["_id"] for action in actions]
+        self.requests.append(ids)
+        for doc_id in ids:
+            remaining = self.statuses.get(doc_id, [])
+            status = remaining.pop(0) if remaining else 200
+            if status == 200:
+                yield True, {"index": {"_id": doc_id, "status": 201}}
+            else:
+                yield False, {
+                    "index": {
+                        "_id": doc_id,
+                        "status": status,
+                        "error": {"type": f"error_{status}", "reason": "rejected"},
+                    }
+                }
+
+
+@pytest.fixture
+def output(monkeypatch) -> ElasticsearchOutput:
+    output = ElasticsearchOutput(index_name="test")
+    output.skip_unchanged = False
+    output.max_retries = 2
+    monkeypatch.setattr(output, "INITIAL_BACKOFF", 0)
+    return output
+
+
+def index_batch(output: ElasticsearchOutput, ids: List[str]):
+    documents = [document(doc_id) for doc_id in ids]
+    payloads = [doc.model_dump_json().encode() for doc in documents]
+    return asyncio.run(output._index_batch(documents, payloads))
+
+
+def test_only_transiently_failed_documents_are_retried(output, monkeypatch):
+    bulk = FakeBulk({"b": [429], "c": [503, 502]})
+    monkeypatch.setattr(elasticsearch_output, "streaming_bulk", bulk)
+
+    assert index_batch(output, ["a", "b", "c"]) == []
+    assert bulk.requests == [["a", "b", "c"], ["b", "c"], ["c"]]
+
+
+def test_permanent_failures_are_not_retried(output, monkeypatch):
+    bulk = FakeBulk({"b": [400]})
+    monkeypatch.setattr(elasticsearch_output, "streaming_bulk", bulk)
+
+    failures = index_batch(output, ["a", "b"])
+    assert [(f.document_id, f.status, f.retries) for f in failures] == [("b", 400, 0)]
+    assert bulk.requests == [["a", "b"]]
+
+
+def test_failures_after_the_last_retry_are_returned(output, monkeypatch):
+    bulk = FakeBulk({"a": [429, 429, 429, 429]})
+    monkeypatch.setattr(elasticsearch_output, "streaming_bulk", bulk)
+
+    failures = index_batch(output, ["a"])
+    assert [(f.document_id, f.error_type, f.retries) for f in failures] == [
+        ("a", "error_429", 2)
+    ]
+    assert len(bulk.requests) == output.max_retries + 1
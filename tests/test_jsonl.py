@@ -0,0 +1,52 @@
+import gzip
+
+from scraper.outputs.jsonl import JsonlWriter, jsonl_paths, read_jsonl
+
+RECORDS = [{"id": str(i), "body": "x" * 20} for i in range(10)]
+
+
+def test_single_file_without_rotation(tmp_path):
+    with JsonlWriter(tmp_path / "out") as writer:
+        writer.write(RECORDS)
+    assert writer.paths == [tmp_path / "out.jsonl"]
+    assert list(read_jsonl(tmp_path / "out")) == RECORDS
+
+
+def test_rotates_into_numbered_parts(tmp_path):
+    # Each line is 44 bytes: a part is full once it holds two of them
+    with JsonlWriter(tmp_path / "out", max_file_bytes=70) as writer:
+        writer.write(RECORDS)
+    assert [path.name for path in writer.paths] == [
+        f"out.{part:04d}.jsonl" for part in range(5)
+    ]
+    assert all(len(path.read_bytes().splitlines()) == 2 for path in writer.paths)
+    assert list(read_jsonl(tmp_path / "out")) == RECORDS
+
+
+def test_reopening_continues_after_the_highest_part(tmp_path):
+    with JsonlWriter(tmp_path / "out", max_file_bytes=70) as writer:
+        writer.write(RECORDS[:4])
+    with JsonlWriter(tmp_path / "out", max_file_bytes=70) as writer:
+        writer.write(RECORDS[4:])
+    assert [path.name for path in writer.paths] == [
+        "out.0002.jsonl",
+        "out.0003.jsonl",
+        "out.0004.jsonl",
+    ]
+    assert list(read_jsonl(tmp_path / "out")) == RECORDS
+
+
+def test_parts_of_other_base_paths_are_ignored(tmp_path):
+    (tmp_path / "out.other.0007.jsonl").write_text("")
+    (tmp_path / "out.0009.jsonl.gz").write_bytes(gzip.compress(b""))
+    with JsonlWriter(tmp_path / "out", max_file_bytes=70) as writer:
+        writer.write(RECORDS[:1])
+    assert [path.name for path in writer.paths] == ["out.0000.jsonl"]
+
+
+def test_gzip_parts_round_trip(tmp_path):
+    with JsonlWriter(tmp_path / "out", compression="gzip", max_file_bytes=70) as writer:
+        writer.write(RECORDS)
+    assert all(path.name.endswith(".jsonl.gz") for path in writer.paths)
+    assert jsonl_paths(tmp_path / "out") == writer.paths
+    assert list(read_jsonl(tmp_path / "out")) == RECORDS
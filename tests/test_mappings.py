@@ -0,0 +1,25 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from scraper.models import ScraperRunDocument
+from scraper.outputs.elasticsearch_mapping import generate_mapping, generated_mappings
+
+MAPPINGS_DIR = Path(__file__).resolve().parents[1] / "scraper" / "mappings"
+
+
+@pytest.mark.parametrize("file_name", sorted(generated_mappings()))
+def test_mapping_files_match_the_models(file_name):
+    # Regenerate with: scraper elastic generate-mappings
+    on_disk = json.loads((MAPPINGS_DIR / file_name).read_text())
+    assert on_disk == generated_mappings()[file_name]
+
+
+def test_source_names_are_keywords():
+    documents = generated_mappings()["documents.json"]["mappings"]["properties"]
+    runs = generate_mapping(ScraperRunDocument)["mappings"]["properties"]
+    assert documents["source"] == {"type": "keyword"}
+    assert runs["source"] == {"type": "keyword"}
+    # Selecting a source's documents by domain needs an exact match too
+    assert documents["domain"]["fields"]["keyword"]["type"] == "keyword"
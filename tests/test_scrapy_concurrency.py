@@ -0,0 +1,112 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Runs in a subprocess: Twisted's asyncio reactor can only be installed once
+SCRAPY_SOURCE = textwrap.dedent(
+    """
+    import asyncio
+    import sys
+
+    from twisted.internet import asyncioreactor
+
+    asyncioreactor.install()
+
+    from twisted.internet import defer, task
+    from twisted.internet.task import react
+
+    from scraper.models import ScrapedDocument, SourceConfig
+    from scraper.outputs.mock_output import MockOutput
+    from scraper.processors import ProcessorManager
+    from scraper.processors.base_processor import BaseProcessor
+    from scraper.scrapers.base import BaseScraper
+    from scraper.scrapers.scrapy.spider_base import BaseSpider
+
+    DOCUMENTS = 30
+
+
+    class SlowProcessor(BaseProcessor):
+        async def process(self, document):
+            await asyncio.sleep(0.01)
+            return document
+
+
+    class Spider:
+        # The real callback, called from Twisted as Scrapy does
+        process_document = BaseSpider.process_document
+
+
+    class ScrapySource(BaseScraper):
+        async def scrape(self):
+            spider = Spider()
+            spider.scraper = self
+            from twisted.internet import reactor
+
+            for i in range(DOCUMENTS):
+                document = ScrapedDocument(
+                    id=str(i),
+                    title="title",
+                    body="body",
+                    domain="https://example.org/",
+                    url=f"https://example.org/{i}",
+                )
+                callback = task.deferLater(
+                    reactor, 0, spider.process_document, None, document
+                )
+                await defer.Deferred.asFuture(
+                    callback, asyncio.get_running_loop()
+                )
+
+
+    def main(reactor):
+        concurrency = int(sys.argv[1])
+        source = SourceConfig(
+            name="example",
+            domain="https://example.org",
+            url="https://example.org",
+            processing_concurrency=concurrency,
+        )
+        # A single-slot flush queue of small batches forces backpressure
+        output = MockOutput(index_name="test", batch_size=2, queue_size=1)
+        scraper = ScrapySource(
+            source, output, ProcessorManager([SlowProcessor()], concurrency)
+        )
+
+        async def run():
+            await scraper.run()
+            assert scraper.total_documents_processed == DOCUMENTS, (
+                scraper.total_documents_processed
+            )
+
+        return defer.Deferred.fromFuture(asyncio.ensure_future(run()))
+
+
+    react(main)
+    """
+)
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_scrapy_source_under_backpressure(tmp_path: Path, concurrency: int):
+    script = tmp_path / "scrapy_source.py"
+    script.write_text(SCRAPY_SOURCE)
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(Path(__file__).resolve().parents[1]),
+        "DATA_DIR": str(tmp_path / "data"),
+        "CLOUD_ID": "unused",
+        "API_KEY": "unused",
+    }
+    result = subprocess.run(
+        [sys.executable, str(script), str(concurrency)],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-3000:]
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Dict, List
+
+import scraper.outputs.elasticsearch_output as elasticsearch_output
+from scraper.models import ScrapedDocument
+from scraper.outputs import ElasticsearchOutput
+
+
+def document(doc_id: str, body: str = "body") -> ScrapedDocument:
+    return ScrapedDocument(
+        id=doc_id,
+        title="title",
+        body=body,
+        domain="https://example.org/",
+        url=f"https://example.org/{doc_id}",
+    )
+
+
+class FakeClient:
+    """Answers mget with the stored content hashes."""
+
+    def __init__(self, stored: Dict[str, str], fail: bool = False):
+        self.stored = stored
+        self.fail = fail
+
+    def mget(self, index, ids, source_includes):
+        if self.fail:
+            raise ConnectionError("unreachable")
+        return {
+            "docs": [
+                {
+                    "_id": doc_id,
+                    "found": True,
+                    "_source": {"content_hash": self.stored[doc_id]},
+                }
+                if doc_id in self.stored
+                else {"_id": doc_id, "found": False}
+                for doc_id in ids
+            ]
+        }
+
+
+def index_batch(
+    output: ElasticsearchOutput, documents: List[ScrapedDocument], monkeypatch
+) -> List[str]:
+    """Index a batch and return the ids sent in the bulk request."""
+    sent = []
+
+    def bulk(client, actions, **kwargs):
+        for action in actions:
+            sent.append(action["_id"])
+            yield True, {"index": {"_id": action["_id"], "status": 200}}
+
+    monkeypatch.setattr(elasticsearch_output, "streaming_bulk", bulk)
+    # Serializing sets the content hash, as index_document does
+    payloads = [output.serialize_document(doc) for doc in documents]
+    assert asyncio.run(output._index_batch(documents, payloads)) == []
+    return sent
+
+
+def test_content_hash_ignores_volatile_fields():
+    first, second = document("a"), document("a")
+    second.indexed_at = "2000-01-01T00:00:00"
+    assert first.compute_content_hash() == second.compute_content_hash()
+    changed = document("a", body="changed")
+    assert changed.compute_content_hash() != first.compute_content_hash()
+
+
+def test_unchanged_documents_are_not_written(monkeypatch):
+    unchanged, changed, new = document("a"), document("b"), document("c")
+    output = ElasticsearchOutput(index_name="test")
+    output.es = FakeClient(
+        {
+            "a": unchanged.compute_content_hash(),
+            "b": document("b", "old").compute_content_hash(),
+        }
+    )
+
+    assert index_batch(output, [unchanged, changed, new], monkeypatch) == ["b", "c"]
+    assert output.documents_skipped == 1
+
+
+def test_fully_unchanged_batch_sends_no_request(monkeypatch):
+    doc = document("a")
+    output = ElasticsearchOutput(index_name="test")
+    output.es = FakeClient({"a": doc.compute_content_hash()})
+
+    assert index_batch(output, [doc], monkeypatch) == []
+    assert output.documents_skipped == 1
+
+
+def test_every_document_is_written_when_the_lookup_fails(monkeypatch):
+    doc = document("a")
+    output = ElasticsearchOutput(index_name="test")
+    output.es = FakeClient({"a": doc.compute_content_hash()}, fail=True)
+
+    assert index_batch(output, [doc], monkeypatch) == ["a"]
+    assert output.documents_skipped == 0
+
+
+def test_payload_holds_the_content_hash():
+    doc = document("a")
+    payload = ElasticsearchOutput(index_name="test").serialize_document(doc)
+    assert ScrapedDocument.model_validate_json(payload) == doc
+    assert doc.content_hash == doc.compute_content_hash()
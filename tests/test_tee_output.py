@@ -0,0 +1,97 @@
+import asyncio
+from typing import List, Optional, Set
+
+from scraper.models import (
+    IndexingFailure,
+    ScrapedDocument,
+    ScraperRunDocument,
+    SourceConfig,
+)
+from scraper.outputs import AbstractOutput, TeeOutput
+from scraper.processors import ProcessorManager
+from scraper.scrapers.base import BaseScraper
+
+
+class RecordingOutput(AbstractOutput):
+    """Keeps written documents and runs in memory, failing or skipping some ids."""
+
+    def __init__(self, fail: Set[str] = (), skip: Set[str] = (), **kwargs):
+        super().__init__(batch_size=2, **kwargs)
+        self.fail = set(fail)
+        self.skip = set(skip)
+        self.written: List[str] = []
+        self.runs: List[ScraperRunDocument] = []
+
+    async def _initialize(self):
+        pass
+
+    async def _cleanup(self):
+        pass
+
+    async def _index_batch(
+        self, documents: List[ScrapedDocument], payloads: List[bytes]
+    ) -> List[IndexingFailure]:
+        failures = []
+        for doc in documents:
+            if doc.id in self.skip:
+                self.documents_skipped += 1
+            elif doc.id in self.fail:
+                failures.append(
+                    IndexingFailure(document_id=doc.id, error_type="rejected")
+                )
+            else:
+                self.written.append(doc.id)
+        return failures
+
+    async def get_last_successful_run(
+        self, source: str
+    ) -> Optional[ScraperRunDocument]:
+        return None
+
+    async def record_run(self, run_document: ScraperRunDocument) -> None:
+        self.runs.append(run_document)
+
+
+class ListScraper(BaseScraper):
+    async def scrape(self):
+        for i in range(5):
+            await self.process_and_index_document(
+                ScrapedDocument(
+                    id=str(i),
+                    title="title",
+                    body="body",
+                    domain="https://example.org/",
+                    url=f"https://example.org/{i}",
+                )
+            )
+
+
+def run_tee(*sinks: RecordingOutput):
+    source = SourceConfig(
+        name="example", domain="https://example.org", url="https://example.org"
+    )
+    tee = TeeOutput(list(sinks), index_name="test", source=source.name)
+    asyncio.run(ListScraper(source, tee, ProcessorManager([])).run())
+
+
+def test_every_sink_receives_every_document():
+    first, second = RecordingOutput(), RecordingOutput()
+    run_tee(first, second)
+    assert first.written == second.written == ["0", "1", "2", "3", "4"]
+
+
+def test_each_sink_records_its_own_counts():
+    failing = RecordingOutput(fail={"1", "2"})
+    skipping = RecordingOutput(skip={"3"})
+    run_tee(failing, skipping)
+
+    (failing_run,) = failing.runs
+    (skipping_run,) = skipping.runs
+    assert failing_run.stats.documents_indexed == 3
+    assert failing_run.stats.documents_failed == 2
+    assert failing_run.stats.documents_skipped == 0
+    assert skipping_run.stats.documents_indexed == 4
+    assert skipping_run.stats.documents_failed == 0
+    assert skipping_run.stats.documents_skipped == 1
+    assert failing_run.source == skipping_run.source == "example"
+    assert [f.document_id for f in failing.failures] == ["1", "2"]
@@ -0,0 +1,73 @@
+import numpy as np
+
+from scraper.processors.textrank import (
+    split_sentences,
+    summarize,
+    textrank,
+    tfidf_matrix,
+)
+
+TEXT = (
+    "Taproot improves the privacy of bitcoin transactions. "
+    "Schnorr signatures make taproot spends smaller and cheaper. "
+    "The weather was nice on the day of the meetup. "
+    "Taproot outputs look the same whether or not they use scripts. "
+    "Key aggregation with Schnorr signatures hides multisig spends in taproot."
+)
+
+
+def test_split_sentences_keeps_abbreviations_and_drops_fragments():
+    text = (
+        "This is a sentence, e.g. with an abbreviation. Too short! "
+        "Another full sentence here."
+    )
+    assert split_sentences(text) == [
+        "This is a sentence, e.g. with an abbreviation.",
+        "Another full sentence here.",
+    ]
+
+
+def test_split_sentences_splits_paragraphs():
+    text = "A first paragraph without a stop\n\nand a second one here"
+    assert split_sentences(text) == [
+        "A first paragraph without a stop",
+        "and a second one here",
+    ]
+
+
+def test_tfidf_rows_are_unit_vectors():
+    vectors = tfidf_matrix(split_sentences(TEXT))
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1)
+
+
+def test_textrank_scores_form_a_distribution():
+    similarity = np.array([[1, 0.5, 0], [0.5, 1, 0.5], [0, 0.5, 1]])
+    scores = textrank(similarity)
+    assert np.isclose(scores.sum(), 1)
+    # The middle node is similar to both others
+    assert scores.argmax() == 1
+
+
+def test_textrank_handles_isolated_nodes():
+    scores = textrank(np.eye(3))
+    assert np.allclose(scores, 1 / 3)
+
+
+def test_summary_keeps_central_sentences_in_text_order():
+    summary = summarize(TEXT, sentences=2)
+    sentences = split_sentences(summary)
+    assert len(sentences) == 2
+    assert "weather" not in summary
+    positions = [TEXT.index(sentence) for sentence in sentences]
+    assert positions == sorted(positions)
+
+
+def test_short_texts_are_kept_whole():
+    text = "Only one sentence in this text."
+    assert summarize(text, sentences=3) == text
+
+
+def test_text_without_sentences_keeps_its_start():
+    # Every paragraph is shorter than a sentence
+    listing = "x = 1\n\ny = 2\n\n" * 50
+    assert summarize(listing) == " ".join(listing.split())[:200]
@@ -0,0 +1,43 @@
+from scraper.processors.topic_extractor_processor import (
+    TopicExtractorProcessor,
+    TopicMatcher,
+)
+
+TOPICS = [
+    "Taproot",
+    "Tap",
+    {"name": "Lightning Network", "aliases": ["LN"]},
+    {"name": "Payjoin", "aliases": ["P2EP", "Pay to Endpoint"]},
+]
+
+
+def matcher() -> TopicMatcher:
+    return TopicMatcher(TopicExtractorProcessor.topic_patterns(TOPICS))
+
+
+def test_counts_names_and_aliases_case_insensitively():
+    hits = matcher().count("The lightning network (LN) uses TAPROOT. ln again.")
+    assert hits == {"Lightning Network": 3, "Taproot": 1}
+
+
+def test_only_whole_words_match():
+    assert matcher().count("taproots tapping untap tap_root") == {}
+    assert matcher().count("tap, taproot") == {"Tap": 1, "Taproot": 1}
+
+
+def test_overlapping_patterns_all_count():
+    # "pay to endpoint" and "p2ep" share no text, both map to Payjoin
+    hits = matcher().count("Pay to endpoint, also known as P2EP or payjoin")
+    assert hits == {"Payjoin": 3}
+
+
+def test_multi_word_topics_match_across_whitespace():
+    text = "Routing on the Lightning\nNetwork and the pay  to\tendpoint proposal"
+    assert matcher().count(text) == {"Lightning Network": 1, "Payjoin": 1}
+
+
+def test_patterns_are_normalized():
+    patterns = TopicExtractorProcessor.topic_patterns(
+        [{"name": "Lightning  Network", "aliases": [" LN "]}]
+    )
+    assert patterns == {"lightning network": "Lightning  Network", "ln": "Lightning  Network"}
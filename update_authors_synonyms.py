@@ -41,10 +41,8 @@ def get_author_synonyms_mapping(url):
 if __name__ == "__main__":
     synonym_mapping = get_author_synonyms_mapping(URL)
 
-    for alias, default_name in synonym_mapping.items():
-        try:
-            res = update_authors_names_from_es(index=INDEX, old_author=alias.strip(), new_author=default_name)
-        except Exception as ex:
-            logger.error(f"Error occurred: {ex} \n{traceback.format_exc()}")
-
-    logger.info("Author synonyms updated successfully.")
+    try:
+        res = update_authors_names_from_es(index=INDEX, synonyms=synonym_mapping)
+        logger.info("Author synonyms updated successfully.")
+    except Exception as ex:
+        logger.error(f"Error occurred: {ex} \n{traceback.format_exc()}")